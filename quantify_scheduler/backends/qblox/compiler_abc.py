@@ -18,6 +18,7 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -218,6 +219,20 @@ class ControlDeviceCompiler(InstrumentCompiler, metaclass=ABCMeta):
         """
         self._pulses[(port, clock)].append(pulse_info)
 
+    def extend_pulses(self, pulses: Iterable[Tuple[str, str, OpInfo]]):
+        """
+        Assigns multiple pulses to this device.
+
+        Equivalent to calling :meth:`~.add_pulse` for every entry, in order.
+
+        Parameters
+        ----------
+        pulses
+            Iterable of (port, clock, pulse_info) tuples, see :meth:`~.add_pulse`.
+        """
+        for port, clock, pulse_info in pulses:
+            self.add_pulse(port, clock, pulse_info)
+
     def add_acquisition(self, port: str, clock: str, acq_info: OpInfo):
         """
         Assigns a certain acquisition to this device.
@@ -254,10 +269,7 @@ class ControlDeviceCompiler(InstrumentCompiler, metaclass=ABCMeta):
             A set containing all the port-clock combinations that are used by this
             InstrumentCompiler.
         """
-        portclocks_used = set()
-        portclocks_used.update(self._pulses.keys())
-        portclocks_used.update(self._acquisitions.keys())
-        return portclocks_used
+        return self._pulses.keys() | self._acquisitions.keys()
 
     @property
     def _portclocks_with_pulses(self) -> Set[Tuple[str, str]]:
@@ -270,9 +282,7 @@ class ControlDeviceCompiler(InstrumentCompiler, metaclass=ABCMeta):
             A set containing all the port-clock combinations that are used by this
             InstrumentCompiler.
         """
-        portclocks_used = set()
-        portclocks_used.update(self._pulses.keys())
-        return portclocks_used
+        return set(self._pulses)
 
     @abstractmethod
     def compile(self, repetitions: int = 1) -> Dict[str, Any]:
@@ -612,9 +622,7 @@ class Sequencer:
         return wf_dict
 
     def _validate_awg_dict(self, wf_dict: Dict[str, Any]) -> None:
-        total_size = 0
-        for waveform in wf_dict.values():
-            total_size += len(waveform["data"])
+        total_size = sum(len(waveform["data"]) for waveform in wf_dict.values())
         if total_size > constants.MAX_SAMPLE_SIZE_WAVEFORMS:
             raise RuntimeError(
                 f"Total waveform size specified for port-clock {self.port}-"
@@ -1248,6 +1256,10 @@ class QbloxBaseModule(ControlDeviceCompiler, ABC):
             Attempting to use more sequencers than available.
 
         """
+        # These properties build a new set on every access, so they are evaluated once.
+        portclocks_with_pulses = self._portclocks_with_pulses
+        portclocks_with_data = self._portclocks_with_data
+
         # Figure out which outputs need to be turned on.
         default_marker = self.static_hw_properties.default_marker
         for io, io_cfg in self.instrument_cfg.items():
@@ -1265,7 +1277,7 @@ class QbloxBaseModule(ControlDeviceCompiler, ABC):
 
             for target in portclock_configs:
                 portclock = (target["port"], target["clock"])
-                if portclock in self._portclocks_with_pulses:
+                if portclock in portclocks_with_pulses:
                     if io in self.static_hw_properties.output_map:
                         default_marker = self.static_hw_properties.output_map[io]
 
@@ -1302,7 +1314,7 @@ class QbloxBaseModule(ControlDeviceCompiler, ABC):
             for target in portclock_configs:
                 portclock = (target["port"], target["clock"])
 
-                if portclock in self._portclocks_with_data:
+                if portclock in portclocks_with_data:
                     connected_outputs = helpers.output_name_to_outputs(io)
                     connected_inputs = helpers.input_name_to_inputs(io)
                     seq_idx = len(sequencers)
@@ -1843,11 +1855,12 @@ class QbloxRFModule(QbloxBaseModule):
         ):
             return
 
+        clock_freq = compiler_container.resources[sequencer.clock]["freq"]
         for lo_idx in QbloxRFModule._get_connected_lo_indices(sequencer):
             lo_freq_setting_name = f"lo{lo_idx}_freq"
             try:
                 freqs = helpers.determine_clock_lo_interm_freqs(
-                    clock_freq=compiler_container.resources[sequencer.clock]["freq"],
+                    clock_freq=clock_freq,
                     lo_freq=getattr(self._settings, lo_freq_setting_name),
                     interm_freq=sequencer.frequency,
                     downconverter_freq=sequencer.downconverter_freq,
@@ -1,20 +1,21 @@
 # Repository: https://gitlab.com/quantify-os/quantify-scheduler
 # Licensed according to the LICENCE file on the main branch
 """Constants for compilation to Qblox hardware."""
+from typing import Final
 
 
 MAX_NUMBER_OF_INSTRUCTIONS_QCM: int = 16384
 """Maximum supported number of instructions in Q1ASM programs for QCM/QCM-RF."""
 MAX_NUMBER_OF_INSTRUCTIONS_QRM: int = 12288
 """Maximum supported number of instructions in Q1ASM programs for QRM/QRM-RF."""
-IMMEDIATE_SZ_GAIN = pow(2, 16) - 1
+IMMEDIATE_SZ_GAIN: Final[int] = 2**16 - 1
 """Size of gain instruction immediates in Q1ASM programs."""
-IMMEDIATE_MAX_WAIT_TIME = pow(2, 16) - 4
+IMMEDIATE_MAX_WAIT_TIME: Final[int] = 2**16 - 4
 """Max size of wait instruction immediates in Q1ASM programs. Max value allowed by
 assembler is 2**16-1, but this is the largest that is a multiple of 4 ns."""
-IMMEDIATE_SZ_OFFSET = pow(2, 16) - 1
+IMMEDIATE_SZ_OFFSET: Final[int] = 2**16 - 1
 """Size of offset instruction immediates in Q1ASM programs."""
-REGISTER_SIZE = pow(2, 32) - 1
+REGISTER_SIZE: Final[int] = 2**32 - 1
 """Size of registers in Q1ASM programs."""
 NCO_PHASE_STEPS_PER_DEG = 1e9 / 360
 """The number of steps per degree for NCO phase instructions arguments."""
@@ -4,20 +4,22 @@
 import dataclasses
 import re
 import warnings
-from copy import deepcopy
+from collections import defaultdict
+from functools import lru_cache, reduce
+from operator import getitem
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import numpy as np
+import xxhash
 
 from quantify_core.utilities import deprecated
-from quantify_core.utilities.general import without
 
 from quantify_scheduler.backends.qblox import constants
 from quantify_scheduler.helpers.waveforms import exec_waveform_function
 from quantify_scheduler.schedules.schedule import AcquisitionMetadata
 from quantify_scheduler.helpers.collections import (
     find_all_port_clock_combinations,
-    find_port_clock_path,
+    find_port_clock_paths,
 )
 from quantify_scheduler.helpers.schedule import (
     extract_acquisition_metadata_from_acquisition_protocols,
@@ -26,7 +28,29 @@ from quantify_scheduler import Schedule
 
 from quantify_scheduler.backends.types.qblox import OpInfo
 from quantify_scheduler.operations.pulse_library import WindowOperation
-from quantify_scheduler.backends.graph_compilation import CompilationConfig
+from quantify_scheduler.backends.graph_compilation import (
+    CompilationConfig,
+    MixerCorrections,
+    ModulationFrequencies,
+)
+
+# Matches the sequencer keys of old-style hardware configs, e.g. "seq0".
+_SEQUENCER_KEY_PATTERN = re.compile(r"^seq\d+$")
+
+
+@lru_cache(maxsize=32)
+def _time_axis(num_samples: int, sampling_rate: float) -> np.ndarray:
+    """
+    Returns the sample times of a waveform. Waveforms of the same length share the
+    same array, which is read-only for that reason. Only the built-in waveform
+    functions get this array as is, custom ones get a writable copy.
+    """
+    # Built as floats and divided in place, which gives the same values as dividing an
+    # integer range without allocating a second array.
+    t = np.arange(num_samples, dtype=np.float64)
+    t /= sampling_rate
+    t.setflags(write=False)
+    return t
 
 
 def generate_waveform_data(
@@ -67,7 +91,7 @@ def generate_waveform_data(
             ) from exc
 
     num_samples = round(duration * sampling_rate)
-    t = np.arange(start=0, stop=num_samples, step=1) / sampling_rate
+    t = _time_axis(num_samples, sampling_rate)
 
     wf_data = exec_waveform_function(
         wf_func=data_dict["wf_func"], t=t, pulse_info=data_dict
@@ -113,12 +137,15 @@ def generate_uuid_from_wf_data(wf_data: np.ndarray, decimals: int = 12) -> str:
     :
         A unique identifier.
     """
-    waveform_hash = hash(wf_data.round(decimals=decimals).tobytes())
+    # The rounded data is hashed through the buffer protocol, without copying it.
+    waveform_hash = xxhash.xxh3_64_intdigest(
+        np.ascontiguousarray(wf_data.round(decimals=decimals))
+    )
     return str(waveform_hash)
 
 
 def add_to_wf_dict_if_unique(
-    wf_dict: Dict[str, Any], waveform: np.ndarray
+    wf_dict: Dict[str, Any], waveform: np.ndarray, uuid: Optional[str] = None
 ) -> Tuple[Dict[str, Any], str, int]:
     """
     Adds a waveform to the waveform dictionary if it is not yet in there and returns the
@@ -130,6 +157,10 @@ def add_to_wf_dict_if_unique(
         The waveform dict in the format expected by the sequencer.
     waveform:
         The waveform to add.
+    uuid:
+        The uuid of the waveform as generated by :func:`generate_uuid_from_wf_data`,
+        if it is already known. This avoids hashing the data of waveforms that are
+        added many times.
 
     Returns
     -------
@@ -140,22 +171,45 @@ def add_to_wf_dict_if_unique(
     int
         The index.
     """
-
-    def generate_entry(name: str, data: np.ndarray, idx: int) -> Dict[str, Any]:
-        return {name: {"data": data.tolist(), "index": idx}}
-
-    if not np.isrealobj(waveform):
+    if waveform.dtype.kind == "c":
         raise RuntimeError("This function only accepts real arrays.")
 
-    uuid = generate_uuid_from_wf_data(waveform)
-    if uuid in wf_dict:
-        index: int = wf_dict[uuid]["index"]
+    if uuid is None:
+        uuid = generate_uuid_from_wf_data(waveform)
+    entry = wf_dict.get(uuid)
+    if entry is not None:
+        index: int = entry["index"]
     else:
         index = len(wf_dict)
-        wf_dict.update(generate_entry(uuid, waveform, len(wf_dict)))
+        # The data is only converted to a list for waveforms that are not yet present.
+        wf_dict[uuid] = {"data": waveform.tolist(), "index": index}
     return wf_dict, uuid, index
 
 
+_OUTPUT_NAME_TO_OUTPUTS = {
+    "complex_output_0": (0, 1),
+    "complex_output_1": (2, 3),
+    "real_output_0": (0,),
+    "real_output_1": (1,),
+    "real_output_2": (2,),
+    "real_output_3": (3,),
+}
+_INPUT_NAME_TO_INPUTS = {
+    "complex_input_0": (0, 1),
+    "real_input_0": (0,),
+    "real_input_1": (1,),
+}
+# The modes of all ios in the two maps above.
+_IO_MODES = {
+    (0,): "real",
+    (1,): "imag",
+    (2,): "real",
+    (3,): "imag",
+    (0, 1): "complex",
+    (2, 3): "complex",
+}
+
+
 def output_name_to_outputs(name: str) -> Optional[Union[Tuple[int], Tuple[int, int]]]:
     """
     Finds the output path index associated with the output names specified in the
@@ -180,14 +234,7 @@ def output_name_to_outputs(name: str) -> Optional[Union[Tuple[int], Tuple[int, i
     if "output" not in name:
         return None
 
-    return {
-        "complex_output_0": (0, 1),
-        "complex_output_1": (2, 3),
-        "real_output_0": (0,),
-        "real_output_1": (1,),
-        "real_output_2": (2,),
-        "real_output_3": (3,),
-    }[name]
+    return _OUTPUT_NAME_TO_OUTPUTS[name]
 
 
 def input_name_to_inputs(name: str) -> Union[Tuple[int], Tuple[int, int]]:
@@ -213,11 +260,7 @@ def input_name_to_inputs(name: str) -> Union[Tuple[int], Tuple[int, int]]:
     if "input" not in name:
         return None
 
-    return {
-        "complex_input_0": (0, 1),
-        "real_input_0": (0,),
-        "real_input_1": (1,),
-    }[name]
+    return _INPUT_NAME_TO_INPUTS[name]
 
 
 def io_mode_from_ios(
@@ -249,6 +292,10 @@ def io_mode_from_ios(
     RuntimeError
         The amount of ios is more than 2, which is impossible for one sequencer.
     """
+    # Fast path for the ios generated from the output and input names
+    if isinstance(io, tuple) and (mode := _IO_MODES.get(io)) is not None:
+        return mode
+
     if len(io) > 2:
         raise RuntimeError(f"Too many io specified for this channel. Given: {io}.")
 
@@ -304,11 +351,8 @@ def generate_waveform_dict(waveforms_complex: Dict[str, np.ndarray]) -> Dict[str
     wf_dict = {}
     for idx, (uuid, complex_data) in enumerate(waveforms_complex.items()):
         name_i, name_q = generate_waveform_names_from_uuid(uuid)
-        to_add = {
-            name_i: {"data": complex_data.real.tolist(), "index": 2 * idx},
-            name_q: {"data": complex_data.imag.tolist(), "index": 2 * idx + 1},
-        }
-        wf_dict.update(to_add)
+        wf_dict[name_i] = {"data": complex_data.real.tolist(), "index": 2 * idx}
+        wf_dict[name_q] = {"data": complex_data.imag.tolist(), "index": 2 * idx + 1}
     return wf_dict
 
 
@@ -553,13 +597,38 @@ def generate_port_clock_to_device_map(
             continue
 
         portclocks = find_all_port_clock_combinations(device_info)
-
-        for portclock in portclocks:
-            portclock_map[portclock] = device_name
+        portclock_map.update(dict.fromkeys(portclocks, device_name))
 
     return portclock_map
 
 
+def _intern_dict(data: dict, interned: Dict[frozenset, dict]) -> dict:
+    """
+    Returns the first dict stored in ``interned`` that is equal to ``data``.
+
+    Dicts containing unhashable values are returned as is.
+
+    Parameters
+    ----------
+    data
+        The dict to intern.
+    interned
+        The dicts interned so far, keyed by their contents.
+
+    Returns
+    -------
+    :
+        A dict equal to ``data``.
+    """
+    try:
+        # The value types are part of the key, such that e.g. 1 and True are not
+        # considered equal.
+        key = frozenset((k, type(v), v) for k, v in data.items())
+    except TypeError:
+        return data
+    return interned.setdefault(key, data)
+
+
 # pylint: disable=too-many-locals
 # pylint: disable=too-many-branches
 def assign_pulse_and_acq_info_to_devices(
@@ -594,60 +663,83 @@ def assign_pulse_and_acq_info_to_devices(
     """
 
     portclock_mapping = generate_port_clock_to_device_map(hardware_cfg)
+    # Pulses without a port are distributed to all (port, device name) pairs that use
+    # their clock.
+    clock_to_portclocks: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for (map_port, map_clock), device_name in portclock_mapping.items():
+        clock_to_portclocks[map_clock].append((map_port, device_name))
+    grid_time_ns = constants.GRID_TIME
+
+    # Operations are typically referred to by many schedulables, so they are only
+    # looked up and validated once. Operations to skip are stored as None.
+    op_cache: Dict[str, Optional[Tuple[Any, str, list, list]]] = {}
+    # The (port, device name) pairs a pulse is assigned to do not depend on its timing,
+    # so they are resolved once per pulse info dict, together with the interned copy
+    # of that dict.
+    pulse_targets: Dict[int, Tuple[dict, List[Tuple[str, str]]]] = {}
+    # Equal pulse info dicts of different operations are shared by the OpInfo objects.
+    interned_dicts: Dict[frozenset, dict] = {}
+    # Pulses are collected per device and handed over in one go at the end.
+    pending_pulses: Dict[str, List[Tuple[str, str, OpInfo]]] = defaultdict(list)
 
     for schedulable in schedule.schedulables.values():
         op_hash = schedulable["operation_repr"]
-        op_data = schedule.operations[op_hash]
+        if op_hash in op_cache:
+            cached_op = op_cache[op_hash]
+        else:
+            op_data = schedule.operations[op_hash]
+            if isinstance(op_data, WindowOperation):
+                cached_op = None
+            elif not op_data.valid_pulse and not op_data.valid_acquisition:
+                raise RuntimeError(
+                    f"Operation {op_hash} is not a valid pulse or acquisition. Please "
+                    f"check whether the device compilation been performed "
+                    f"successfully. Operation data: {repr(op_data)}"
+                )
+            else:
+                cached_op = (
+                    op_data,
+                    op_data.data["name"],
+                    op_data.data["pulse_info"],
+                    op_data.data["acquisition_info"],
+                )
+            op_cache[op_hash] = cached_op
 
-        if isinstance(op_data, WindowOperation):
+        if cached_op is None:
             continue
-
-        if not op_data.valid_pulse and not op_data.valid_acquisition:
-            raise RuntimeError(
-                f"Operation {op_hash} is not a valid pulse or acquisition. Please check"
-                f" whether the device compilation been performed successfully. "
-                f"Operation data: {repr(op_data)}"
-            )
+        op_data, op_name, pulse_infos, acq_infos = cached_op
 
         operation_start_time = schedulable["abs_time"]
-        for pulse_data in op_data.data["pulse_info"]:
-            if "t0" in pulse_data:
-                pulse_start_time = operation_start_time + pulse_data["t0"]
-            else:
-                pulse_start_time = operation_start_time
-            # Check whether start time aligns with grid time
-            try:
-                _ = to_grid_time(pulse_start_time)
-            except ValueError as exc:
-                raise ValueError(
-                    f"An operation start time of {pulse_start_time * 1e9} ns does not "
-                    f"align with a grid time of {constants.GRID_TIME} ns. Please make "
-                    f"sure the start time of all operations is a multiple of "
-                    f"{constants.GRID_TIME} ns.\n\nOffending operation:"
-                    f"\n{repr(op_data)}."
-                ) from exc
-
-            if pulse_data.get("reference_magnitude", None) is not None:
-                raise NotImplementedError
-
-            port = pulse_data["port"]
-            clock = pulse_data["clock"]
-
-            combined_data = OpInfo(
-                name=op_data.data["name"],
-                data=pulse_data,
-                timing=pulse_start_time,
-            )
+        for pulse_data in pulse_infos:
+            pulse_start_time = operation_start_time + pulse_data.get("t0", 0)
+            # Check whether start time aligns with grid time. The check of
+            # to_grid_time is inlined, the function is only called to raise.
+            if round(pulse_start_time * 1e9) % grid_time_ns != 0:
+                try:
+                    _ = to_grid_time(pulse_start_time, grid_time_ns)
+                except ValueError as exc:
+                    raise ValueError(
+                        f"An operation start time of {pulse_start_time * 1e9} ns does "
+                        f"not align with a grid time of {grid_time_ns} ns. Please make "
+                        f"sure the start time of all operations is a multiple of "
+                        f"{grid_time_ns} ns.\n\nOffending operation:"
+                        f"\n{repr(op_data)}."
+                    ) from exc
 
-            if port is None:
-                # Distribute clock operations to all sequencers utilizing that clock
-                for (map_port, map_clock), device_name in portclock_mapping.items():
-                    if map_clock == clock:
-                        device_compilers[device_name].add_pulse(
-                            port=map_port, clock=clock, pulse_info=combined_data
-                        )
-            else:
-                if (port, clock) not in portclock_mapping:
+            clock = pulse_data["clock"]
+            if (cached_pulse := pulse_targets.get(pulse_id := id(pulse_data))) is None:
+                if pulse_data.get("reference_magnitude", None) is not None:
+                    raise NotImplementedError
+
+                if (port := pulse_data["port"]) is None:
+                    # Distribute clock operations to all sequencers utilizing that clock
+                    targets = clock_to_portclocks.get(clock, [])
+                elif (device_name := portclock_mapping.get((port, clock))) is None:
+                    combined_data = OpInfo(
+                        name=op_name,
+                        data=pulse_data,
+                        timing=pulse_start_time,
+                    )
                     raise KeyError(
                         f"Could not assign pulse data to device. The combination "
                         f"of port {port} and clock {clock} could not be found "
@@ -655,16 +747,22 @@ def assign_pulse_and_acq_info_to_devices(
                         f"specified in the hardware configuration?\n\n"
                         f"Relevant operation:\n{combined_data}."
                     )
-                device_name = portclock_mapping[(port, clock)]
-                device_compilers[device_name].add_pulse(
-                    port=port, clock=clock, pulse_info=combined_data
-                )
+                else:
+                    targets = [(port, device_name)]
+                cached_pulse = (_intern_dict(pulse_data, interned_dicts), targets)
+                pulse_targets[pulse_id] = cached_pulse
 
-        for acq_data in op_data.data["acquisition_info"]:
-            if "t0" in acq_data:
-                acq_start_time = operation_start_time + acq_data["t0"]
-            else:
-                acq_start_time = operation_start_time
+            canonical_data, targets = cached_pulse
+            combined_data = OpInfo(
+                name=op_name,
+                data=canonical_data,
+                timing=pulse_start_time,
+            )
+            for port, device_name in targets:
+                pending_pulses[device_name].append((port, clock, combined_data))
+
+        for acq_data in acq_infos:
+            acq_start_time = operation_start_time + acq_data.get("t0", 0)
 
             port = acq_data["port"]
             clock = acq_data["clock"]
@@ -672,24 +770,13 @@ def assign_pulse_and_acq_info_to_devices(
             if port is None:
                 continue
 
-            hashed_dict = without(acq_data, ["t0", "waveforms"])
-            hashed_dict["waveforms"] = []
-            for acq in acq_data["waveforms"]:
-                if "t0" in acq:
-                    # TODO 'without' will raise a KeyError if the key is not already
-                    # present. Keep only the else-part and update the requirements when
-                    # quantify-core!438 is in the latest release.
-                    hashed_dict["waveforms"].append(without(acq, ["t0"]))
-                else:
-                    hashed_dict["waveforms"].append(acq)
-
             combined_data = OpInfo(
-                name=op_data.data["name"],
+                name=op_name,
                 data=acq_data,
                 timing=acq_start_time,
             )
 
-            if (port, clock) not in portclock_mapping:
+            if (device_name := portclock_mapping.get((port, clock))) is None:
                 raise KeyError(
                     f"Could not assign acquisition data to device. The combination "
                     f"of port {port} and clock {clock} could not be found "
@@ -697,11 +784,26 @@ def assign_pulse_and_acq_info_to_devices(
                     f"specified in the hardware configuration?\n\n"
                     f"Relevant operation:\n{combined_data}."
                 )
-            device_name = portclock_mapping[(port, clock)]
             device_compilers[device_name].add_acquisition(
                 port=port, clock=clock, acq_info=combined_data
             )
 
+    for device_name, pulses in pending_pulses.items():
+        device_compilers[device_name].extend_pulses(pulses)
+
+
+def _copy_hardware_config(config: Any) -> Any:
+    """
+    Copies the dicts and lists of a JSON-like hardware config, sharing all other
+    values, which are immutable in such a config. Unlike :func:`copy.deepcopy`, this
+    does not keep a memo of the copied objects.
+    """
+    if isinstance(config, dict):
+        return {key: _copy_hardware_config(value) for key, value in config.items()}
+    if isinstance(config, list):
+        return [_copy_hardware_config(value) for value in config]
+    return config
+
 
 @deprecated(
     "0.16.0",
@@ -736,12 +838,20 @@ def convert_hw_config_to_portclock_configs_spec(
 
     """
 
-    def _update_hw_config(nested_dict, max_depth=4):
-        if max_depth == 0:
-            return
-        # List is needed because the dictionary keys are changed during recursion
-        for key, value in list(nested_dict.items()):
-            if isinstance(key, str) and re.match(r"^seq\d+$", key):
+    hw_config = _copy_hardware_config(hw_config)
+
+    # Depth-first traversal of the nested dicts up to a depth of 4, using a stack of
+    # item iterators instead of recursion. The items of a dict are listed when it is
+    # entered, because the dictionary keys are changed during the traversal.
+    stack = [(hw_config, iter(list(hw_config.items())), 4)]
+    while stack:
+        nested_dict, items, max_depth = stack[-1]
+        for key, value in items:
+            if (
+                isinstance(key, str)
+                and key.startswith("seq")
+                and _SEQUENCER_KEY_PATTERN.match(key)
+            ):
                 nested_dict["portclock_configs"] = nested_dict.get(
                     "portclock_configs", []
                 )
@@ -759,11 +869,12 @@ def convert_hw_config_to_portclock_configs_spec(
                 nested_dict["portclock_configs"].append(value)
                 del nested_dict[key]
 
-            elif isinstance(value, dict):
-                _update_hw_config(value, max_depth - 1)
-
-    hw_config = deepcopy(hw_config)
-    _update_hw_config(hw_config)
+            elif isinstance(value, dict) and max_depth > 1:
+                # Continue with this dict, the remaining items are visited afterwards
+                stack.append((value, iter(list(value.items())), max_depth - 1))
+                break
+        else:
+            stack.pop()
 
     return hw_config
 
@@ -869,6 +980,141 @@ def single_scope_mode_acquisition_raise(sequencer_0, sequencer_1, module_name):
     )
 
 
+# Shared by the errors raised when the hardware options conflict with the config.
+_VALUE_CONFLICT_ADVICE = (
+    "To avoid conflicting settings, please make sure this value is only set in one "
+    "place."
+)
+_CORRECTIONS_CONFLICT_ADVICE = (
+    "To avoid conflicting settings, please make sure these corrections are only set "
+    "in one place."
+)
+
+
+def _get_nested(config: Any, path: list) -> Any:
+    """Returns the item of a nested config at a path of keys and list indices."""
+    return reduce(getitem, path, config)
+
+
+def _set_modulation_frequencies(
+    hardware_config: Dict[str, Any],
+    port: str,
+    clock: str,
+    pc_path: list,
+    ch_config: Dict[str, Any],
+    pc_config: Dict[str, Any],
+    pc_mod_freqs: ModulationFrequencies,
+    is_rf_by_instr: Dict[tuple, bool],
+) -> None:
+    """
+    Sets the modulation frequencies of a port-clock in the hardware config.
+
+    ``ch_config`` and ``pc_config`` are the channel and port-clock configs found at
+    ``pc_path``. ``is_rf_by_instr`` caches whether the instrument at a path is an RF
+    module, which is shared by all port-clocks of an instrument.
+    """
+    # Set the interm_freq in the port-clock config.
+    # Checking for the key, because IF=None is also a valid setting
+    if "interm_freq" not in pc_config:
+        pc_config["interm_freq"] = pc_mod_freqs.interm_freq
+    elif (legacy_interm_freq := pc_config["interm_freq"]) != pc_mod_freqs.interm_freq:
+        raise ValueError(
+            f"Trying to set IF for {port=}, {clock=} to"
+            f" {pc_mod_freqs.interm_freq} from the hardware options while it"
+            f" has previously been set to {legacy_interm_freq} in the hardware"
+            f" config. {_VALUE_CONFLICT_ADVICE}"
+        )
+
+    # Exclude the port-clock config index, "portclock_config", and "complex_output_X"
+    # keys to find the instrument config.
+    instr_path = tuple(pc_path[:-3])
+    if (is_rf_module := is_rf_by_instr.get(instr_path)) is None:
+        instr_config = _get_nested(hardware_config, instr_path)
+        # All RF instrument types ("QCM_RF", "Pulsar_QRM_RF", ...) share this suffix.
+        is_rf_module = instr_config["instrument_type"].endswith("_RF")
+        is_rf_by_instr[instr_path] = is_rf_module
+
+    # If RF module, set the lo frequency in the output (channel) config:
+    if is_rf_module:
+        # Checking for the key, because lo_freq=None is also a valid setting
+        if "lo_freq" not in ch_config:
+            ch_config["lo_freq"] = pc_mod_freqs.lo_freq
+        elif (legacy_lo_freq := ch_config["lo_freq"]) != pc_mod_freqs.lo_freq:
+            raise ValueError(
+                f"Trying to set LO frequency for {port=}, {clock=} to"
+                f" {pc_mod_freqs.lo_freq} from the hardware options while"
+                f" it has previously been set to {legacy_lo_freq} in"
+                f" the hardware config. {_VALUE_CONFLICT_ADVICE}"
+            )
+    # Else, set the lo frequency in the external lo config:
+    else:
+        lo_name: str = ch_config["lo_name"]
+        if (lo_config := hardware_config.get(lo_name)) is None:
+            raise RuntimeError(
+                f"External local oscillator '{lo_name}' set to "
+                f"be used for {port=} and {clock=} not found! Make "
+                f"sure it is present in the hardware configuration."
+            )
+        # Checking for the key, because lo_freq=None is also a valid setting
+        if "frequency" not in lo_config:
+            lo_config["frequency"] = pc_mod_freqs.lo_freq
+        elif (legacy_lo_freq := lo_config["frequency"]) != pc_mod_freqs.lo_freq:
+            raise ValueError(
+                f"Trying to set frequency for {lo_name} to"
+                f" {pc_mod_freqs.lo_freq} from the hardware options while"
+                f" it has previously been set to {legacy_lo_freq} in"
+                f" the hardware config. {_VALUE_CONFLICT_ADVICE}"
+            )
+
+
+def _set_mixer_corrections(
+    pc_path: list,
+    ch_config: Dict[str, Any],
+    pc_config: Dict[str, Any],
+    pc_mix_corr: MixerCorrections,
+) -> None:
+    """
+    Sets the mixer corrections of a port-clock in its channel and port-clock configs,
+    which are found at ``pc_path`` in the hardware config.
+    """
+    new_mix_corr = (
+        pc_mix_corr.amp_ratio,
+        pc_mix_corr.phase_error,
+        pc_mix_corr.dc_offset_i,
+        pc_mix_corr.dc_offset_q,
+    )
+
+    # Add mixer corrections from hardware options to channel config
+    legacy_mix_corr = (
+        pc_config.get("mixer_amp_ratio"),
+        pc_config.get("mixer_phase_error_deg"),
+        ch_config.get("dc_mixer_offset_I"),
+        ch_config.get("dc_mixer_offset_Q"),
+    )
+    if legacy_mix_corr == (None, None, None, None):
+        (
+            pc_config["mixer_amp_ratio"],
+            pc_config["mixer_phase_error_deg"],
+            ch_config["dc_mixer_offset_I"],
+            ch_config["dc_mixer_offset_Q"],
+        ) = new_mix_corr
+    elif legacy_mix_corr != new_mix_corr:
+        # The corrections are only labeled for the error message.
+        mix_corr_keys = (
+            "mixer_amp_ratio",
+            "mixer_phase_error_deg",
+            "dc_mixer_offset_I",
+            "dc_mixer_offset_Q",
+        )
+        raise ValueError(
+            f"Trying to set mixer corrections for channel={pc_path[:-2]} to "
+            f"{dict(zip(mix_corr_keys, new_mix_corr))} from the hardware "
+            f"options while it has previously been set to "
+            f"{dict(zip(mix_corr_keys, legacy_mix_corr))} in the hardware "
+            f"config. {_CORRECTIONS_CONFLICT_ADVICE}"
+        )
+
+
 def generate_hardware_config(compilation_config: CompilationConfig):
     """
     Extract the old-style Qblox hardware config from the CompilationConfig.
@@ -898,12 +1144,16 @@ def generate_hardware_config(compilation_config: CompilationConfig):
             f"hardware config dict:\n {compilation_config.connectivity=}"
         )
 
-    hardware_config = deepcopy(compilation_config.connectivity)
+    hardware_config = _copy_hardware_config(compilation_config.connectivity)
     hardware_options = compilation_config.hardware_options
-    port_clocks = find_all_port_clock_combinations(hardware_config)
+
+    # Only the corrections are serialized, instead of all hardware options.
+    corrections = hardware_options.dict(
+        include={"latency_corrections", "distortion_corrections"}
+    )
 
     # Add latency corrections from hardware options to hardware config
-    latency_corrections = hardware_options.dict()["latency_corrections"]
+    latency_corrections = corrections["latency_corrections"]
     legacy_latency_corrections = hardware_config.get("latency_corrections")
 
     if latency_corrections is None:
@@ -914,12 +1164,12 @@ def generate_hardware_config(compilation_config: CompilationConfig):
         raise ValueError(
             f"Trying to set latency corrections to {latency_corrections} from "
             f"the hardware options while it has previously been set to "
-            f"{legacy_latency_corrections} in the hardware config. To avoid conflicting "
-            f"settings, please make sure these corrections are only set in one place."
+            f"{legacy_latency_corrections} in the hardware config. "
+            f"{_CORRECTIONS_CONFLICT_ADVICE}"
         )
 
     # Add distortion corrections from hardware options to hardware config
-    distortion_corrections = hardware_options.dict()["distortion_corrections"]
+    distortion_corrections = corrections["distortion_corrections"]
     legacy_distortion_corrections = hardware_config.get("distortion_corrections")
 
     if distortion_corrections is None:
@@ -930,126 +1180,52 @@ def generate_hardware_config(compilation_config: CompilationConfig):
         raise ValueError(
             f"Trying to set distortion corrections to {distortion_corrections} from "
             f"the hardware options while it has previously been set to "
-            f"{legacy_distortion_corrections} in the hardware config. To avoid conflicting "
-            f"settings, please make sure these corrections are only set in one place."
+            f"{legacy_distortion_corrections} in the hardware config. "
+            f"{_CORRECTIONS_CONFLICT_ADVICE}"
         )
 
-    if compilation_config.hardware_options.modulation_frequencies is not None:
-        for port, clock in port_clocks:
-            if (
-                pc_mod_freqs := compilation_config.hardware_options.modulation_frequencies.get(
-                    f"{port}-{clock}"
-                )
-            ) is None:
-                # No modulation frequencies to set for this port-clock.
+    modulation_frequencies = hardware_options.modulation_frequencies
+    mixer_corrections = hardware_options.mixer_corrections
+    if modulation_frequencies is not None or mixer_corrections is not None:
+        # The port-clocks of an instrument share its instrument type, so it is looked
+        # up once per instrument.
+        is_rf_by_instr: Dict[tuple, bool] = {}
+        # A single traversal finds both the port-clock combinations and their paths,
+        # which are iterated together instead of looking up each path again.
+        pc_paths = find_port_clock_paths(hardware_config)
+        for (port, clock), pc_path in pc_paths.items():
+            if port is None:
                 continue
-            pc_path = find_port_clock_path(
-                hardware_config=hardware_config, port=port, clock=clock
+            # The hardware options are keyed by "port-clock" strings.
+            pc_key = f"{port}-{clock}"
+            pc_mod_freqs = (
+                None
+                if modulation_frequencies is None
+                else modulation_frequencies.get(pc_key)
             )
-            # Set the interm_freq in the port-clock config.
-            pc_config = hardware_config
-            for key in pc_path:
-                pc_config = pc_config[key]
-
-            legacy_interm_freq = pc_config.get("interm_freq", "not_present")
-            # Using default="not_present" because IF=None is also a valid setting
-            if legacy_interm_freq == "not_present":
-                pc_config["interm_freq"] = pc_mod_freqs.interm_freq
-            elif legacy_interm_freq != pc_mod_freqs.interm_freq:
-                raise ValueError(
-                    f"Trying to set IF for {port=}, {clock=} to"
-                    f" {pc_mod_freqs.interm_freq} from the hardware options while it"
-                    f" has previously been set to {legacy_interm_freq} in the hardware"
-                    f" config. To avoid conflicting settings, please make sure this"
-                    f" value is only set in one place."
-                )
-
-            # Extract instrument config and output config.
-            instr_config = hardware_config
-            # Exclude the port-clock config index, "portclock_config", and "complex_output_X" keys.
-            for key in pc_path[:-3]:
-                instr_config = instr_config[key]
-            output_config = instr_config[pc_path[-3]]
-
-            # If RF module, set the lo frequency in the output config:
-            if "RF" in instr_config["instrument_type"]:
-                legacy_lo_freq = output_config.get("lo_freq", "not_present")
-                # Using default="not_present" because lo_freq=None is also a valid setting
-                if legacy_lo_freq == "not_present":
-                    output_config["lo_freq"] = pc_mod_freqs.lo_freq
-                elif legacy_lo_freq != pc_mod_freqs.lo_freq:
-                    raise ValueError(
-                        f"Trying to set frequency for {lo_name} to"
-                        f" {pc_mod_freqs.lo_freq} from the hardware options while"
-                        f" it has previously been set to {legacy_lo_freq} in"
-                        f" the hardware config. To avoid conflicting settings,"
-                        f" please make sure this value is only set in one place."
-                    )
-            # Else, set the lo frequency in the external lo config:
-            else:
-                lo_name: str = output_config["lo_name"]
-                if (lo_config := hardware_config.get(lo_name)) is None:
-                    raise RuntimeError(
-                        f"External local oscillator '{lo_name}' set to "
-                        f"be used for {port=} and {clock=} not found! Make "
-                        f"sure it is present in the hardware configuration."
-                    )
-                legacy_lo_freq = lo_config.get("frequency", "not_present")
-                # Using default="not_present" because lo_freq=None is also a valid setting
-                if legacy_lo_freq == "not_present":
-                    lo_config["frequency"] = pc_mod_freqs.lo_freq
-                elif legacy_lo_freq != pc_mod_freqs.lo_freq:
-                    raise ValueError(
-                        f"Trying to set frequency for {lo_name} to"
-                        f" {pc_mod_freqs.lo_freq} from the hardware options while"
-                        f" it has previously been set to {legacy_lo_freq} in"
-                        f" the hardware config. To avoid conflicting settings,"
-                        f" please make sure this value is only set in one place."
-                    )
-
-    mixer_corrections = compilation_config.hardware_options.mixer_corrections
-
-    if mixer_corrections is not None:
-        for port, clock in port_clocks:
-            if (pc_mix_corr := mixer_corrections.get(f"{port}-{clock}")) is None:
-                # No mixer corrections to set for this port-clock.
-                continue
-            pc_mix_corr = {
-                "mixer_amp_ratio": pc_mix_corr.amp_ratio,
-                "mixer_phase_error_deg": pc_mix_corr.phase_error,
-                "dc_mixer_offset_I": pc_mix_corr.dc_offset_i,
-                "dc_mixer_offset_Q": pc_mix_corr.dc_offset_q,
-            }
-            pc_path = find_port_clock_path(
-                hardware_config=hardware_config, port=port, clock=clock
+            pc_mix_corr = (
+                None if mixer_corrections is None else mixer_corrections.get(pc_key)
             )
-            ch_config = hardware_config
-            # Remove port-clock index and "portclock_configs" key to find channel config:
-            for key in pc_path[:-2]:
-                ch_config = ch_config[key]
-            pc_config = ch_config["portclock_configs"][pc_path[-1]]
-
-            # Add mixer corrections from hardware options to channel config
-            legacy_mix_corr = {
-                "mixer_amp_ratio": pc_config.get("mixer_amp_ratio"),
-                "mixer_phase_error_deg": pc_config.get("mixer_phase_error_deg"),
-                "dc_mixer_offset_I": ch_config.get("dc_mixer_offset_I"),
-                "dc_mixer_offset_Q": ch_config.get("dc_mixer_offset_Q"),
-            }
-            if all(v is None for v in legacy_mix_corr.values()):
-                pc_config["mixer_amp_ratio"] = pc_mix_corr["mixer_amp_ratio"]
-                pc_config["mixer_phase_error_deg"] = pc_mix_corr[
-                    "mixer_phase_error_deg"
-                ]
-                ch_config["dc_mixer_offset_I"] = pc_mix_corr["dc_mixer_offset_I"]
-                ch_config["dc_mixer_offset_Q"] = pc_mix_corr["dc_mixer_offset_Q"]
-            elif legacy_mix_corr != pc_mix_corr:
-                raise ValueError(
-                    f"Trying to set mixer corrections for channel={pc_path[:-2]} to "
-                    f"{pc_mix_corr} from the hardware options while it has previously "
-                    f"been set to {legacy_mix_corr} in the hardware config. To avoid "
-                    f"conflicting settings, please make sure these corrections are "
-                    f"only set in one place."
+            if pc_mod_freqs is None and pc_mix_corr is None:
+                # Nothing to set for this port-clock.
+                continue
+            # Both settings are written into the channel and port-clock configs, so
+            # these are resolved once. Removing the port-clock index and
+            # "portclock_configs" key from the path gives the channel config.
+            ch_config = _get_nested(hardware_config, pc_path[:-2])
+            pc_config = ch_config[pc_path[-2]][pc_path[-1]]
+            if pc_mod_freqs is not None:
+                _set_modulation_frequencies(
+                    hardware_config,
+                    port,
+                    clock,
+                    pc_path,
+                    ch_config,
+                    pc_config,
+                    pc_mod_freqs,
+                    is_rf_by_instr,
                 )
+            if pc_mix_corr is not None:
+                _set_mixer_corrections(pc_path, ch_config, pc_config, pc_mix_corr)
 
     return hardware_config
@@ -3,7 +3,8 @@
 """Compiler classes for Qblox backend."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from collections import abc
 
 from quantify_scheduler.backends.qblox import compiler_abc, compiler_container
@@ -67,6 +68,10 @@ class LocalOscillator(compiler_abc.InstrumentCompiler):
             self._settings.frequency
         )
         self.power_param_name, self._power = _extract_parameter(self._settings.power)
+        # The settings are fixed after construction, so the QCoDeS parameter paths
+        # used in the compiled program are formatted only once.
+        self._freq_param_path = f"{self.name}.{self.freq_param_name}"
+        self._power_param_path = f"{self.name}.{self.power_param_name}"
 
     @property
     def frequency(self) -> Optional[float]:
@@ -125,8 +130,8 @@ class LocalOscillator(compiler_abc.InstrumentCompiler):
         if self._frequency is None:
             return None
         return {
-            f"{self.name}.{self.freq_param_name}": self._frequency,
-            f"{self.name}.{self.power_param_name}": self._power,
+            self._freq_param_path: self._frequency,
+            self._power_param_path: self._power,
         }
 
 
@@ -207,14 +212,16 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
     Compiler class for a Qblox cluster.
     """
 
-    compiler_classes: Dict[str, type] = {
-        "QCM": QcmModule,
-        "QRM": QrmModule,
-        "QCM_RF": QcmRfModule,
-        "QRM_RF": QrmRfModule,
-    }
+    compiler_classes: Mapping[str, type] = MappingProxyType(
+        {
+            "QCM": QcmModule,
+            "QRM": QrmModule,
+            "QCM_RF": QcmRfModule,
+            "QRM_RF": QrmRfModule,
+        }
+    )
     """References to the individual module compiler classes that can be used by the
-    cluster."""
+    cluster. Read-only, as it is shared by all cluster compilers."""
     supports_acquisition: bool = True
     """Specifies that the Cluster supports performing acquisitions."""
 
@@ -265,6 +272,12 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
             compiler.
         """
         instrument_compilers = {}
+        # Maps each port-clock to the module compilers that can target it, such that
+        # the data can be distributed without visiting every module's port-clocks.
+        self._portclock_owners: Dict[
+            Tuple[str, str], List[compiler_abc.QbloxBaseModule]
+        ] = {}
+        compiler_classes = self.compiler_classes
         for name, cfg in self.instrument_cfg.items():
             if not isinstance(cfg, dict):
                 continue  # not an instrument definition
@@ -272,16 +285,16 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
                 raise KeyError(
                     f"Module {name} of cluster {self.name} is specified in "
                     f"the config, but does not specify an 'instrument_type'."
-                    f"\n\nValid values: {self.compiler_classes.keys()}"
+                    f"\n\nValid values: {compiler_classes.keys()}"
                 )
             instrument_type: str = cfg["instrument_type"]
-            if instrument_type not in self.compiler_classes:
+            compiler_type: Optional[type] = compiler_classes.get(instrument_type)
+            if compiler_type is None:
                 raise KeyError(
                     f"Specified unknown instrument_type {instrument_type} as"
                     f" a module for cluster {self.name}. Please select one "
-                    f"of: {self.compiler_classes.keys()}."
+                    f"of: {compiler_classes.keys()}."
                 )
-            compiler_type: type = self.compiler_classes[instrument_type]
             instance = compiler_type(
                 parent=self,
                 name=name,
@@ -293,6 +306,8 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
             instance.is_pulsar = False
 
             instrument_compilers[name] = instance
+            for portclock in instance.portclocks:
+                self._portclock_owners.setdefault(portclock, []).append(instance)
         return instrument_compilers
 
     def prepare(self) -> None:
@@ -308,15 +323,14 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
         Distributes the pulses and acquisitions assigned to the cluster over the
         individual module compilers.
         """
-        for compiler in self.instrument_compilers.values():
-            for portclock in compiler.portclocks:
-                port, clock = portclock
-                if portclock in self._pulses:
-                    for pulse in self._pulses[portclock]:
-                        compiler.add_pulse(port, clock, pulse)
-                if portclock in self._acquisitions:
-                    for acq in self._acquisitions[portclock]:
-                        compiler.add_acquisition(port, clock, acq)
+        for (port, clock), pulses in self._pulses.items():
+            for compiler in self._portclock_owners.get((port, clock), ()):
+                for pulse in pulses:
+                    compiler.add_pulse(port, clock, pulse)
+        for (port, clock), acquisitions in self._acquisitions.items():
+            for compiler in self._portclock_owners.get((port, clock), ()):
+                for acq in acquisitions:
+                    compiler.add_acquisition(port, clock, acq)
 
     def compile(self, repetitions: int = 1) -> Optional[Dict[str, Any]]:
         """
@@ -332,19 +346,18 @@ class Cluster(compiler_abc.ControlDeviceCompiler):
         :
             The part of the compiled instructions relevant for this instrument.
         """
-        program = {}
-        program["settings"] = {"reference_source": self.instrument_cfg["ref"]}
+        # The cluster settings are always part of the program, also when none of the
+        # modules produce one.
+        program = {"settings": {"reference_source": self.instrument_cfg["ref"]}}
 
         sequence_to_file = self.instrument_cfg.get("sequence_to_file", None)
         for compiler in self.instrument_compilers.values():
             instrument_program = compiler.compile(
                 repetitions=repetitions, sequence_to_file=sequence_to_file
             )
-            if instrument_program is not None and len(instrument_program) > 0:
+            if instrument_program:
                 program[compiler.name] = instrument_program
 
-        if len(program) == 0:
-            program = None
         return program
 
 
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import logging
 from collections import namedtuple
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
 import numpy as np
 
@@ -15,10 +16,115 @@ from quantify_scheduler.backends.qblox import constants, helpers, q1asm_instruct
 from quantify_scheduler.backends.qblox.operation_handling.base import IOperationStrategy
 from quantify_scheduler.backends.qblox.qasm_program import QASMProgram
 from quantify_scheduler.backends.types import qblox as types
-from quantify_scheduler.helpers.waveforms import normalize_waveform_data
+from quantify_scheduler.helpers.waveforms import (
+    _read_only_zeros,
+    normalize_waveform_data,
+)
 
 logger = logging.getLogger(__name__)
 
+_PULSE_STITCHING_DURATION_NS = helpers.to_grid_time(constants.PULSE_STITCHING_DURATION)
+"""The duration of a single stitched square pulse in ns."""
+
+
+@lru_cache(maxsize=4)
+def _stitched_square_waveforms(
+    num_samples: int,
+) -> Tuple[np.ndarray, str, np.ndarray, str]:
+    """
+    Returns the waveforms of ones and zeros played by stitched square pulses, each
+    followed by its uuid. These are the same for every pulse, hence they are shared
+    and read-only.
+    """
+    ones = np.ones(num_samples)
+    ones.setflags(write=False)
+    zeros = np.zeros(num_samples)
+    zeros.setflags(write=False)
+    return (
+        ones,
+        helpers.generate_uuid_from_wf_data(ones),
+        zeros,
+        helpers.generate_uuid_from_wf_data(zeros),
+    )
+
+
+class _NormalizedWaveform(NamedTuple):
+    """A sampled and normalized waveform, see :func:`_sampled_and_normalized`."""
+
+    data: np.ndarray
+    imag: np.ndarray
+    """The imaginary part of the data."""
+    amp_real: float
+    amp_imag: float
+    is_complex: bool
+    """Whether the data has a nonzero imaginary part."""
+    uuid_real: Optional[str] = None
+    """The uuid of the real part, if it is known already."""
+    uuid_imag: Optional[str] = None
+    """The uuid of the imaginary part, if it is known already."""
+
+
+def _sampled_and_normalized(data: Dict[str, Any]) -> _NormalizedWaveform:
+    """
+    Samples and normalizes the waveform of a pulse, see
+    :func:`~quantify_scheduler.helpers.waveforms.normalize_waveform_data`.
+
+    Schedules typically play the same pulse many times, so the results are cached by
+    the pulse parameters if these are all hashable, including the uuids of the real
+    and imaginary parts. The cached arrays are read-only. The cache is cleared at the
+    start of every compilation, see :func:`clear_waveform_caches`.
+    """
+    key = tuple(sorted(data.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable pulse parameters, e.g. a list of values.
+        return _sample_and_normalize(data)
+    return _cached_sampled_and_normalized(key)
+
+
+def clear_waveform_caches() -> None:
+    """
+    Clears the cached waveforms.
+
+    The cache key of a waveform contains the import path of its waveform function, not
+    the function itself. Clearing the cache at the start of a compilation ensures that
+    a redefined or reloaded waveform function is used from then on.
+    """
+    _cached_sampled_and_normalized.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _cached_sampled_and_normalized(
+    data_items: Tuple[Tuple[str, Any], ...]
+) -> _NormalizedWaveform:
+    """Cached implementation of :func:`_sampled_and_normalized`."""
+    waveform = _sample_and_normalize(dict(data_items))
+    waveform.data.setflags(write=False)
+    waveform.imag.setflags(write=False)
+    return waveform._replace(
+        uuid_real=helpers.generate_uuid_from_wf_data(waveform.data.real),
+        uuid_imag=helpers.generate_uuid_from_wf_data(waveform.imag),
+    )
+
+
+def _sample_and_normalize(data: Dict[str, Any]) -> _NormalizedWaveform:
+    """Samples and normalizes the waveform of a pulse, without caching."""
+    waveform_data = helpers.generate_waveform_data(
+        data, sampling_rate=constants.SAMPLING_RATE
+    )
+    waveform_data, amp_real, amp_imag = normalize_waveform_data(waveform_data)
+    # The normalized data is only complex if its imaginary amplitude is nonzero, in
+    # which case the imaginary part contains a +/-1, so no second scan is needed.
+    is_complex = np.iscomplexobj(waveform_data)
+    if is_complex:
+        imag_data = waveform_data.imag
+    else:
+        # The imaginary part of a real array is a new array of zeros, which is
+        # avoided for the (common) real waveforms.
+        imag_data = _read_only_zeros(len(waveform_data), waveform_data.dtype)
+    return _NormalizedWaveform(waveform_data, imag_data, amp_real, amp_imag, is_complex)
+
 
 class PulseStrategyPartial(IOperationStrategy):
     """Contains the logic shared between all the pulses."""
@@ -134,15 +240,17 @@ class GenericPulseStrategy(PulseStrategyPartial):
             to "complex".
         """  # pylint: disable=line-too-long
         op_info = self.operation_info
-        waveform_data = helpers.generate_waveform_data(
-            op_info.data, sampling_rate=constants.SAMPLING_RATE
+        waveform = _sampled_and_normalized(op_info.data)
+        amp_real, amp_imag = waveform.amp_real, waveform.amp_imag
+        self.waveform_len = len(waveform.data)
+        _, _, idx_real = helpers.add_to_wf_dict_if_unique(
+            wf_dict, waveform.data.real, uuid=waveform.uuid_real
+        )
+        _, _, idx_imag = helpers.add_to_wf_dict_if_unique(
+            wf_dict, waveform.imag, uuid=waveform.uuid_imag
         )
-        waveform_data, amp_real, amp_imag = normalize_waveform_data(waveform_data)
-        self.waveform_len = len(waveform_data)
-        _, _, idx_real = helpers.add_to_wf_dict_if_unique(wf_dict, waveform_data.real)
-        _, _, idx_imag = helpers.add_to_wf_dict_if_unique(wf_dict, waveform_data.imag)
 
-        if np.any(np.iscomplex(waveform_data)) and not self.io_mode == "complex":
+        if waveform.is_complex and not self.io_mode == "complex":
             raise ValueError(
                 f"Complex valued {str(op_info)} detected but the sequencer"
                 f" is not expecting complex input. This can be caused by "
@@ -231,13 +339,13 @@ class StitchedSquarePulseStrategy(PulseStrategyPartial):
         op_info = self.operation_info
         amplitude = op_info.data["amp"]
 
-        array_with_ones = np.ones(
+        ones, ones_uuid, zeros, zeros_uuid = _stitched_square_waveforms(
             int(constants.PULSE_STITCHING_DURATION * constants.SAMPLING_RATE)
         )
-        _, _, idx_ones = helpers.add_to_wf_dict_if_unique(wf_dict, array_with_ones.real)
+        _, _, idx_ones = helpers.add_to_wf_dict_if_unique(wf_dict, ones, uuid=ones_uuid)
         if self.io_mode == "complex":
             _, _, idx_zeros = helpers.add_to_wf_dict_if_unique(
-                wf_dict, array_with_ones.imag
+                wf_dict, zeros, uuid=zeros_uuid
             )
             self.waveform_index0, self.waveform_index1 = idx_ones, idx_zeros
             self.amplitude_path0, self.amplitude_path1 = amplitude, 0
@@ -260,8 +368,12 @@ class StitchedSquarePulseStrategy(PulseStrategyPartial):
         qasm_program
             The QASMProgram to add the assembly instructions to.
         """
-        duration = self.operation_info.duration
-        repetitions = int(duration // constants.PULSE_STITCHING_DURATION)
+        # Splitting the duration in integer nanoseconds avoids the rounding errors of
+        # a float modulo, e.g. 0.3 ms is 300 stitched pulses and not 299 plus 1 us.
+        repetitions, pulse_time_remaining = divmod(
+            helpers.to_grid_time(self.operation_info.duration),
+            _PULSE_STITCHING_DURATION_NS,
+        )
 
         self._check_amplitudes_set()
 
@@ -277,25 +389,18 @@ class StitchedSquarePulseStrategy(PulseStrategyPartial):
                     q1asm_instructions.PLAY,
                     self.waveform_index0,
                     self.waveform_index1,
-                    helpers.to_grid_time(constants.PULSE_STITCHING_DURATION),
-                )
-                qasm_program.elapsed_time += repetitions * helpers.to_grid_time(
-                    constants.PULSE_STITCHING_DURATION
+                    _PULSE_STITCHING_DURATION_NS,
                 )
+            qasm_program.elapsed_time += repetitions * _PULSE_STITCHING_DURATION_NS
         elif repetitions == 1:
             qasm_program.emit(
                 q1asm_instructions.PLAY,
                 self.waveform_index0,
                 self.waveform_index1,
-                helpers.to_grid_time(constants.PULSE_STITCHING_DURATION),
-            )
-            qasm_program.elapsed_time += helpers.to_grid_time(
-                constants.PULSE_STITCHING_DURATION
+                _PULSE_STITCHING_DURATION_NS,
             )
+            qasm_program.elapsed_time += _PULSE_STITCHING_DURATION_NS
 
-        pulse_time_remaining = helpers.to_grid_time(
-            duration % constants.PULSE_STITCHING_DURATION
-        )
         if pulse_time_remaining > 0:
             logger.warning(
                 f"Using pulse stitching with pulse duration that is not a multiple of "
@@ -395,7 +395,8 @@ class QASMProgram:
         ValueError
             Parameter is not in the normalized range.
         """
-        if np.abs(val) > 1.0:
+        # The builtin abs avoids the overhead of a numpy ufunc call on a scalar.
+        if abs(val) > 1.0:
             raise ValueError(
                 f"{param} is set to {val}. Parameter must be in the range "
                 f"-1.0 <= {param} <= 1.0 for {repr(operation)}."
@@ -17,6 +17,9 @@ from quantify_scheduler.backends.graph_compilation import (
     HardwareOptions,
 )
 from quantify_scheduler.backends.qblox import compiler_container, constants, helpers
+from quantify_scheduler.backends.qblox.operation_handling.pulses import (
+    clear_waveform_caches,
+)
 from quantify_scheduler.operations.pulse_factories import long_square_pulse
 
 
@@ -207,6 +210,7 @@ def hardware_compile(
 
     schedule = apply_distortion_corrections(schedule, hardware_cfg)
 
+    clear_waveform_caches()
     container = compiler_container.CompilerContainer.from_hardware_cfg(
         schedule, hardware_cfg
     )
@@ -52,12 +52,16 @@ class StaticHardwareProperties:
 
 
 @dataclass(frozen=True)
-class OpInfo(DataClassJsonMixin):
+class OpInfo:
     """
     Data structure describing a pulse or acquisition and containing all the information
     required to play it.
     """
 
+    # Large schedules create an OpInfo for every pulse and acquisition, hence slots are
+    # used to avoid an instance dict for each of them.
+    __slots__ = ("name", "data", "timing")
+
     name: str
     """Name of the operation that this pulse/acquisition is part of."""
     data: dict
@@ -69,6 +73,23 @@ class OpInfo(DataClassJsonMixin):
     operation, and the t0 of the pulse/acquisition which specifies a time relative
     to "t_abs"."""
 
+    def __getstate__(self) -> Tuple[str, dict, float]:
+        return self.name, self.data, self.timing
+
+    def __setstate__(self, state: Tuple[str, dict, float]) -> None:
+        # Bypass the frozen __setattr__, as is done by the dataclass __init__.
+        for slot, value in zip(self.__slots__, state):
+            object.__setattr__(self, slot, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the fields of this OpInfo as a dictionary."""
+        return {"name": self.name, "data": self.data, "timing": self.timing}
+
+    @classmethod
+    def from_dict(cls, kvs: Dict[str, Any]) -> OpInfo:
+        """Creates an OpInfo from a dictionary as returned by :meth:`to_dict`."""
+        return cls(**kvs)
+
     @property
     def duration(self) -> float:
         """The duration of the pulse/acquisition."""
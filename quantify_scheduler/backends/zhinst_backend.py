@@ -32,7 +32,7 @@ from quantify_scheduler.helpers import schedule as schedule_helpers
 from quantify_scheduler.helpers import waveforms as waveform_helpers
 from quantify_scheduler.helpers.collections import (
     find_all_port_clock_combinations,
-    find_port_clock_path,
+    find_port_clock_paths,
 )
 from quantify_scheduler.instrument_coordinator.components.generic import (
     DEFAULT_NAME as GENERIC_ICC_DEFAULT_NAME,
@@ -739,9 +739,18 @@ def generate_hardware_config(  # noqa: PLR0912, PLR0915
     hardware_config = deepcopy(compilation_config.connectivity)
     hardware_options = compilation_config.hardware_options
     port_clocks = find_all_port_clock_combinations(hardware_config)
+    # The paths of all port-clocks are found in a single traversal of the config,
+    # instead of searching the config again for every port-clock.
+    pc_paths = find_port_clock_paths(hardware_config)
+
+    # Only the corrections are serialized, and only once, instead of serializing all
+    # hardware options for each of them.
+    corrections = hardware_options.dict(
+        include={"latency_corrections", "distortion_corrections"}
+    )
 
     # Add latency corrections from hardware options to hardware config
-    latency_corrections = hardware_options.dict()["latency_corrections"]
+    latency_corrections = corrections["latency_corrections"]
     legacy_latency_corrections = hardware_config.get("latency_corrections")
 
     if latency_corrections is None:
@@ -757,7 +766,7 @@ def generate_hardware_config(  # noqa: PLR0912, PLR0915
         )
 
     # Add distortion corrections from hardware options to hardware config
-    distortion_corrections = hardware_options.dict()["distortion_corrections"]
+    distortion_corrections = corrections["distortion_corrections"]
     legacy_distortion_corrections = hardware_config.get("distortion_corrections")
 
     if distortion_corrections is None:
@@ -773,16 +782,14 @@ def generate_hardware_config(  # noqa: PLR0912, PLR0915
             f"set in one place."
         )
 
-    modulation_frequencies = compilation_config.hardware_options.modulation_frequencies
+    modulation_frequencies = hardware_options.modulation_frequencies
 
     if modulation_frequencies is not None:
         for port, clock in port_clocks:
             if (pc_mod_freqs := modulation_frequencies.get(f"{port}-{clock}")) is None:
                 # No modulation frequencies to set for this port-clock.
                 continue
-            ch_path = find_port_clock_path(
-                hardware_config=hardware_config, port=port, clock=clock
-            )
+            ch_path = pc_paths[(port, clock)]
             # Set the interm_freq in the channel config:
             ch_config = hardware_config
             for key in ch_path:
@@ -844,7 +851,7 @@ def generate_hardware_config(  # noqa: PLR0912, PLR0915
                     f"sure it is present in the hardware configuration."
                 )
 
-    mixer_corrections = compilation_config.hardware_options.mixer_corrections
+    mixer_corrections = hardware_options.mixer_corrections
 
     if mixer_corrections is not None:
         for port, clock in port_clocks:
@@ -857,9 +864,7 @@ def generate_hardware_config(  # noqa: PLR0912, PLR0915
                 "dc_offset_I": pc_mix_corr.dc_offset_i,
                 "dc_offset_Q": pc_mix_corr.dc_offset_q,
             }
-            ch_path = find_port_clock_path(
-                hardware_config=hardware_config, port=port, clock=clock
-            )
+            ch_path = pc_paths[(port, clock)]
             ch_config = hardware_config
             for key in ch_path:
                 ch_config = ch_config[key]
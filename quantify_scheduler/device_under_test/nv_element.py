@@ -4,7 +4,7 @@
 Device elements for NV centers. Currently only for the electronic qubit,
 but could be extended for other qubits (eg. carbon qubit).
 """
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
 from qcodes.instrument import InstrumentModule
 from qcodes.instrument.base import InstrumentBase
@@ -13,6 +13,7 @@ from qcodes.instrument.parameter import (
     Parameter,
 )
 from qcodes.utils import validators
+from quantify_scheduler.backends.circuit_to_device import compile_circuit_to_device
 from quantify_scheduler.backends.graph_compilation import (
     DeviceCompilationConfig,
     OperationCompilationConfig,
@@ -402,6 +403,10 @@ class BasicElectronicNVElement(DeviceElement):
         self.cr_count: CRCount
         """Submodule :class:`~.CRCount`."""
 
+        self._device_config_cache: Optional[
+            Tuple[Tuple[Any, ...], DeviceCompilationConfig]
+        ] = None
+
     def _generate_config(self) -> Dict[str, Dict[str, OperationCompilationConfig]]:
         """
         Generates part of the device configuration specific to a single qubit.
@@ -409,6 +414,11 @@ class BasicElectronicNVElement(DeviceElement):
         This method is intended to be used when this object is part of a
         device object containing multiple elements.
         """
+        ge0_clock = f"{self.name}.ge0"
+        ge1_clock = f"{self.name}.ge1"
+        optical_control_port = self.ports.optical_control()
+        optical_readout_port = self.ports.optical_readout()
+
         qubit_config = {
             f"{self.name}": {
                 "spectroscopy_operation": OperationCompilationConfig(
@@ -425,8 +435,8 @@ class BasicElectronicNVElement(DeviceElement):
                     factory_kwargs={
                         "duration": self.reset.duration(),
                         "amp": self.reset.amplitude(),
-                        "port": self.ports.optical_control(),
-                        "clock": f"{self.name}.ge1",
+                        "port": optical_control_port,
+                        "clock": ge1_clock,
                     },
                 ),
                 "charge_reset": OperationCompilationConfig(
@@ -434,7 +444,7 @@ class BasicElectronicNVElement(DeviceElement):
                     factory_kwargs={
                         "duration": self.charge_reset.duration(),
                         "amp": self.charge_reset.amplitude(),
-                        "port": self.ports.optical_control(),
+                        "port": optical_control_port,
                         "clock": f"{self.name}.ionization",
                     },
                 ),
@@ -443,13 +453,13 @@ class BasicElectronicNVElement(DeviceElement):
                     factory_kwargs={
                         "pulse_amplitudes": [self.measure.pulse_amplitude()],
                         "pulse_durations": [self.measure.pulse_duration()],
-                        "pulse_ports": [self.ports.optical_control()],
-                        "pulse_clocks": [f"{self.name}.ge0"],
+                        "pulse_ports": [optical_control_port],
+                        "pulse_clocks": [ge0_clock],
                         "acq_duration": self.measure.acq_duration(),
                         "acq_delay": self.measure.acq_delay(),
                         "acq_channel": self.measure.acq_channel(),
-                        "acq_port": self.ports.optical_readout(),
-                        "acq_clock": f"{self.name}.ge0",
+                        "acq_port": optical_readout_port,
+                        "acq_clock": ge0_clock,
                         "pulse_type": "SquarePulse",
                         "acq_protocol_default": "TriggerCount",
                     },
@@ -467,18 +477,18 @@ class BasicElectronicNVElement(DeviceElement):
                             self.cr_count.spinpump_pulse_duration(),
                         ],
                         "pulse_ports": [
-                            self.ports.optical_control(),
-                            self.ports.optical_control(),
+                            optical_control_port,
+                            optical_control_port,
                         ],
                         "pulse_clocks": [
-                            f"{self.name}.ge0",
-                            f"{self.name}.ge1",
+                            ge0_clock,
+                            ge1_clock,
                         ],
                         "acq_duration": self.cr_count.acq_duration(),
                         "acq_delay": self.cr_count.acq_delay(),
                         "acq_channel": self.cr_count.acq_channel(),
-                        "acq_port": self.ports.optical_readout(),
-                        "acq_clock": f"{self.name}.ge0",
+                        "acq_port": optical_readout_port,
+                        "acq_clock": ge0_clock,
                         "pulse_type": "SquarePulse",
                         "acq_protocol_default": "TriggerCount",
                     },
@@ -498,20 +508,37 @@ class BasicElectronicNVElement(DeviceElement):
         .. note:
 
             This config is only valid for single qubit experiments.
+
+        The config is cached as long as none of the parameters of this element change,
+        and a copy of it is returned.
         """
-        cfg_dict = {
-            "backend": "quantify_scheduler.backends"
-            ".circuit_to_device.compile_circuit_to_device",
-            "elements": self._generate_config(),
-            "clocks": {
+        # The raw cached values are used, as getting the parameters could query an
+        # instrument.
+        signature = tuple(
+            parameter.cache.raw_value
+            for submodule in self.submodules.values()
+            for parameter in submodule.parameters.values()
+        )
+        if (
+            self._device_config_cache is not None
+            and self._device_config_cache[0] == signature
+        ):
+            return self._device_config_cache[1].copy(deep=True)
+
+        # All fields are built here from validated parameters, so the config is
+        # constructed directly instead of being parsed and validated again.
+        dev_cfg = DeviceCompilationConfig.construct(
+            backend=compile_circuit_to_device,
+            elements=self._generate_config(),
+            clocks={
                 f"{self.name}.f01": self.clock_freqs.f01(),
                 f"{self.name}.spec": self.clock_freqs.spec(),
                 f"{self.name}.ge0": self.clock_freqs.ge0(),
                 f"{self.name}.ge1": self.clock_freqs.ge1(),
                 f"{self.name}.ionization": self.clock_freqs.ionization(),
             },
-            "edges": {},
-        }
-        dev_cfg = DeviceCompilationConfig.parse_obj(cfg_dict)
+            edges={},
+        )
+        self._device_config_cache = (signature, dev_cfg)
 
-        return dev_cfg
+        return dev_cfg.copy(deep=True)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import copy
 from collections import UserDict
-from typing import Any, List, Iterable, Tuple
+from typing import Any, Dict, List, Iterable, Tuple
 
 import numpy as np
 import xxhash
@@ -80,8 +80,9 @@ def find_inner_dicts_containing_key(d: dict, key: Any) -> List[dict]:
     Generates a list of the first dictionaries encountered that contain a certain key,
     in a complicated dictionary with nested dictionaries or Iterables.
 
-    This is achieved by recursively traversing the nested structures until the key is
-    found, which is then appended to a list.
+    This is achieved by traversing the nested structures depth-first, using an
+    explicit stack rather than recursion, until the key is found, which is then
+    appended to a list.
 
     Parameters
     ----------
@@ -96,22 +97,29 @@ def find_inner_dicts_containing_key(d: dict, key: Any) -> List[dict]:
         A list containing all the inner dictionaries containing the specified key.
     """
     dicts_found = []
-    if isinstance(d, dict):
-        if key in d:
-            dicts_found.append(d)
-    for val in d.values():
-        if isinstance(val, (dict, UserDict)):
-            dicts_found.extend(find_inner_dicts_containing_key(val, key))
-        elif isinstance(val, Iterable) and not isinstance(val, str):
-            for i_item in val:
-                try:
-                    dicts_found.extend(find_inner_dicts_containing_key(i_item, key))
-                # having a list that contains something other than a dict can cause an
-                # AttributeError on d, but this should be ignored anyway
-                except AttributeError:
-                    continue
-        else:
-            continue
+    # Items of Iterables are flagged, as they are skipped if they are not dict-like.
+    stack = [(d, False)]
+    while stack:
+        inner, is_item = stack.pop()
+        if isinstance(inner, dict) and key in inner:
+            dicts_found.append(inner)
+        try:
+            values = inner.values()
+        # having a list that contains something other than a dict can cause an
+        # AttributeError, but this should be ignored anyway
+        except AttributeError:
+            if is_item:
+                continue
+            raise
+
+        # Children are pushed in reverse to visit them in order.
+        children = []
+        for val in values:
+            if isinstance(val, (dict, UserDict)):
+                children.append((val, False))
+            elif isinstance(val, Iterable) and not isinstance(val, str):
+                children.extend((i_item, True) for i_item in val)
+        stack.extend(reversed(children))
     return dicts_found
 
 
@@ -204,3 +212,47 @@ def find_port_clock_path(hardware_config: dict, port: str, clock: str) -> list |
         )
     else:
         return port_clock_path
+
+
+def find_port_clock_paths(hardware_config: dict) -> Dict[Tuple[str, str], list]:
+    """
+    Finds the paths to all port-clock combinations in a nested dictionary.
+
+    Unlike calling :func:`find_port_clock_path` once for every port-clock combination,
+    this traverses the (nested) hardware config only once.
+
+    Parameters
+    ----------
+    hardware_config
+        The (nested) hardware config dictionary to loop over.
+
+    Returns
+    -------
+    :
+        A dictionary with as key a tuple representing a port-clock combination, and as
+        value a list representing the keys to that port-clock combination in the
+        hardware config, in the format returned by :func:`find_port_clock_path`. If a
+        port-clock combination occurs more than once, the first path encountered is
+        kept.
+    """
+    port_clock_paths: Dict[Tuple[str, str], list] = {}
+    stack = [(hardware_config, [])]
+    while stack:
+        config, path = stack.pop()
+        if "port" in config:
+            port_clock_paths.setdefault((config["port"], config.get("clock")), path)
+
+        # Children are pushed in reverse to visit them in the order of the config.
+        children = []
+        for key, value in config.items():
+            if isinstance(value, dict):
+                children.append((value, path + [key]))
+            elif isinstance(value, list):
+                children.extend(
+                    (sub_config, path + [key, idx])
+                    for idx, sub_config in enumerate(value)
+                    if isinstance(sub_config, dict)
+                )
+        stack.extend(reversed(children))
+
+    return port_clock_paths
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import inspect
-from functools import partial
-from typing import Any, Dict, List, Protocol, Tuple
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Protocol, Tuple
 
 import numpy as np
 
@@ -68,11 +68,23 @@ def resize_waveforms(waveforms_dict: Dict[int, np.ndarray], granularity: int) ->
     granularity
         The granularity.
     """
-    # Modify the list while iterating to avoid copies
-    for pulse_id in waveforms_dict:
-        waveforms_dict[pulse_id] = resize_waveform(
-            waveforms_dict[pulse_id], granularity
-        )
+    # Modify the dict while iterating to avoid copies. Replacing the values of
+    # existing keys does not change the size of the dict, so this is allowed.
+    for pulse_id, waveform in waveforms_dict.items():
+        resized_waveform = resize_waveform(waveform, granularity)
+        if resized_waveform is not waveform:
+            waveforms_dict[pulse_id] = resized_waveform
+
+
+@lru_cache(maxsize=32)
+def _read_only_zeros(size: int, dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Returns a read-only array of zeros, shared between all calls with that size and
+    dtype.
+    """
+    zeros = np.zeros(size, dtype=dtype)
+    zeros.setflags(write=False)
+    return zeros
 
 
 def resize_waveform(waveform: np.ndarray, granularity: int) -> np.ndarray:
@@ -96,13 +108,16 @@ def resize_waveform(waveform: np.ndarray, granularity: int) -> np.ndarray:
     if size == 0:
         return np.zeros(granularity)
 
-    if size % granularity == 0:
+    padded_size = -(-size // granularity) * granularity
+    if padded_size == size:
         return waveform
 
-    remainder = math.closest_number_ceil(size, granularity) - size
-
-    # Append the waveform with the remainder zeros
-    return np.concatenate([waveform, np.zeros(remainder)])
+    # Pad the waveform with zeros, using a single allocation
+    resized_waveform = np.zeros(
+        padded_size, dtype=np.result_type(waveform.dtype, np.float64)
+    )
+    resized_waveform[:size] = waveform
+    return resized_waveform
 
 
 def shift_waveform(
@@ -190,7 +205,13 @@ def get_waveform_by_pulseid(
         The schedule.
     """
     pulseid_waveformfn_dict: Dict[int, GetWaveformPartial] = {}
+    operations_done = set()
     for schedulable in schedule.schedulables.values():
+        # Operations are typically referred to by many schedulables, but the pulse ids
+        # only depend on the operation, so these are hashed once per operation.
+        if schedulable["operation_repr"] in operations_done:
+            continue
+        operations_done.add(schedulable["operation_repr"])
         operation = schedule.operations[schedulable["operation_repr"]]
         for pulse_info in operation["pulse_info"]:
             pulse_id = schedule_helpers.get_pulse_uuid(pulse_info)
@@ -245,6 +266,40 @@ def exec_waveform_partial(
     return waveform
 
 
+_WAVEFORMS_MODULE_PREFIX = "quantify_scheduler.waveforms."
+# The waveform functions are looked up on the module at call time, such that they can
+# be patched.
+_BUILTIN_WAVEFORM_FUNCTIONS: Dict[str, Callable[[np.ndarray, dict], np.ndarray]] = {
+    "square": lambda t, pulse_info: waveforms.square(t=t, amp=pulse_info["amp"]),
+    "ramp": lambda t, pulse_info: waveforms.ramp(
+        t=t, amp=pulse_info["amp"], offset=pulse_info.get("offset", 0)
+    ),
+    "soft_square": lambda t, pulse_info: waveforms.soft_square(
+        t=t, amp=pulse_info["amp"]
+    ),
+    "staircase": lambda t, pulse_info: waveforms.staircase(
+        t=t,
+        start_amp=pulse_info["start_amp"],
+        final_amp=pulse_info["final_amp"],
+        num_steps=pulse_info["num_steps"],
+    ),
+    "chirp": lambda t, pulse_info: waveforms.chirp(
+        t=t,
+        amp=pulse_info["amp"],
+        start_freq=pulse_info["start_freq"],
+        end_freq=pulse_info["end_freq"],
+    ),
+    "drag": lambda t, pulse_info: waveforms.drag(
+        t=t,
+        G_amp=pulse_info["G_amp"],
+        D_amp=pulse_info["D_amp"],
+        duration=pulse_info["duration"],
+        nr_sigma=pulse_info["nr_sigma"],
+        phase=pulse_info["phase"],
+    ),
+}
+
+
 def exec_waveform_function(wf_func: str, t: np.ndarray, pulse_info: dict) -> np.ndarray:
     """
     Returns the result of the pulse's waveform function.
@@ -267,34 +322,17 @@ def exec_waveform_function(wf_func: str, t: np.ndarray, pulse_info: dict) -> np.
     :
         Returns the computed waveform.
     """
-    whitelist: List[str] = ["square", "ramp", "soft_square", "drag"]
-    fn_name: str = wf_func.split(".")[-1]
-    waveform: np.ndarray = []
-    if wf_func.startswith("quantify_scheduler.waveforms") and fn_name in whitelist:
-        if fn_name == "square":
-            waveform = waveforms.square(t=t, amp=pulse_info["amp"])
-        elif fn_name == "ramp":
-            if "offset" in pulse_info.keys():
-                waveform = waveforms.ramp(
-                    t=t, amp=pulse_info["amp"], offset=pulse_info["offset"]
-                )
-            else:
-                waveform = waveforms.ramp(t=t, amp=pulse_info["amp"])
-        elif fn_name == "soft_square":
-            waveform = waveforms.soft_square(t=t, amp=pulse_info["amp"])
-        elif fn_name == "drag":
-            waveform = waveforms.drag(
-                t=t,
-                G_amp=pulse_info["G_amp"],
-                D_amp=pulse_info["D_amp"],
-                duration=pulse_info["duration"],
-                nr_sigma=pulse_info["nr_sigma"],
-                phase=pulse_info["phase"],
-            )
-    else:
-        waveform = exec_custom_waveform_function(wf_func, t, pulse_info)
-
-    return waveform
+    if wf_func.startswith(_WAVEFORMS_MODULE_PREFIX) and (
+        builtin_func := _BUILTIN_WAVEFORM_FUNCTIONS.get(
+            wf_func[len(_WAVEFORMS_MODULE_PREFIX) :]
+        )
+    ):
+        return builtin_func(t, pulse_info)
+    if not t.flags.writeable:
+        # Custom waveform functions may modify the time axis in place, which is not
+        # allowed for shared read-only time axes.
+        t = t.copy()
+    return exec_custom_waveform_function(wf_func, t, pulse_info)
 
 
 def exec_custom_waveform_function(
@@ -323,19 +361,28 @@ def exec_custom_waveform_function(
     """
     # Load the waveform function from string
     function = import_python_object_from_string(wf_func)
+    par_names = _waveform_parameter_names(function)
 
     # select the arguments for the waveform function that are present
     # in pulse info
-    par_map = inspect.signature(function).parameters
-    wf_kwargs = {}
-    for key in par_map.keys():
-        if key in pulse_info:
-            wf_kwargs[key] = pulse_info[key]
+    wf_kwargs = {key: pulse_info[key] for key in par_names if key in pulse_info}
 
     # Calculate the numerical waveform using the wf_func
     return function(t=t, **wf_kwargs)
 
 
+@lru_cache(maxsize=128)
+def _waveform_parameter_names(function: Callable) -> Tuple[str, ...]:
+    """
+    Returns the parameter names of a waveform function.
+
+    :func:`inspect.signature` is slow compared to evaluating most waveforms, hence the
+    result is cached per function object. The function itself is imported on every
+    call, such that a reloaded or redefined function is always used.
+    """
+    return tuple(inspect.signature(function).parameters)
+
+
 def apply_mixer_skewness_corrections(
     waveform: np.ndarray, amplitude_ratio: float, phase_shift: float
 ) -> np.ndarray:
@@ -22,6 +22,13 @@ current_python_version = sys.version_info
 
 lru_cache = functools.lru_cache(maxsize=200)
 
+# Objects of these types are serialized to a string and recreated with ``__init__``.
+_STR_SERIALIZED_TYPES = (complex, np.int32, np.complex128, np.int64, enums.BinMode)
+# These types themselves are serialized by name.
+_NAME_SERIALIZED_TYPES = frozenset(
+    (complex, float, int, bool, str, np.ndarray, np.complex128, np.int32, np.int64)
+)
+
 
 def validate_json(data, schema):
     """Validate schema using jsonschema-rs"""
@@ -274,7 +281,7 @@ class ScheduleJSONEncoder(json.JSONEncoder):
         """
         if hasattr(o, "__getstate__"):
             return o.__getstate__()
-        if isinstance(o, (complex, np.int32, np.complex128, np.int64, enums.BinMode)):
+        if isinstance(o, _STR_SERIALIZED_TYPES):
             return {
                 "deserialization_type": type(o).__name__,
                 "mode": "__init__",
@@ -286,17 +293,7 @@ class ScheduleJSONEncoder(json.JSONEncoder):
                 "mode": "__init__",
                 "data": list(o),
             }
-        if o in [
-            complex,
-            float,
-            int,
-            bool,
-            str,
-            np.ndarray,
-            np.complex128,
-            np.int32,
-            np.int64,
-        ]:
+        if isinstance(o, type) and o in _NAME_SERIALIZED_TYPES:
             return {"deserialization_type": o.__name__, "mode": "type"}
         if hasattr(o, "__dict__"):
             return o.__dict__
@@ -8,6 +8,7 @@ import inspect
 import logging
 from collections import UserDict
 from enum import Enum
+from itertools import chain
 from pydoc import locate
 from typing import Optional
 import warnings
@@ -140,7 +141,7 @@ class Operation(JSONSchemaValMixin, UserDict):
         self._duration = max(
             map(
                 _get_operation_end,
-                self.data["pulse_info"] + self.data["acquisition_info"],
+                chain(self.data["pulse_info"], self.data["acquisition_info"]),
             ),
             default=0,
         )
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict, Any, Union, Literal
 from dataclasses import dataclass
+import sys
 import warnings
 
 import numpy as np
@@ -17,6 +18,31 @@ from quantify_scheduler.backends.qblox import constants as qblox_constants
 from quantify_scheduler.helpers.waveforms import area_pulses
 from quantify_scheduler.resources import BasebandClockResource
 
+# Bound once, as it is looked up for every IdlePulse and every pulse in
+# _extract_pulses.
+_BASEBAND_IDENTITY = BasebandClockResource.IDENTITY
+
+# The pulse info of an IdlePulse only differs in its duration, so it is copied from
+# this template. Do not modify, the values are shared by all IdlePulses.
+_IDLE_PULSE_INFO = {
+    "wf_func": None,
+    "t0": 0,
+    "duration": 0,
+    "clock": _BASEBAND_IDENTITY,
+    "port": None,
+}
+
+
+def _intern(string: Optional[str]) -> Optional[str]:
+    """
+    Interns a port or clock name, such that the many pulses referring to the same
+    port or clock share a single string object. Other values are returned as is.
+    """
+    try:
+        return sys.intern(string)
+    except TypeError:
+        return string
+
 
 @dataclass
 class ReferenceMagnitude:
@@ -72,21 +98,16 @@ class ShiftClockPhase(Operation):
         """
         if data is None:
             super().__init__(name="ShiftClockPhase")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "ShiftClockPhase",
-                    "pulse_info": [
-                        {
-                            "wf_func": None,
-                            "t0": t0,
-                            "phase_shift": phase_shift,
-                            "clock": clock,
-                            "port": None,
-                            "duration": 0,
-                        }
-                    ],
+                    "wf_func": None,
+                    "t0": t0,
+                    "phase_shift": phase_shift,
+                    "clock": _intern(clock),
+                    "port": None,
+                    "duration": 0,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -124,21 +145,16 @@ class ResetClockPhase(Operation):
         """
         if data is None:
             super().__init__(name="ResetClockPhase")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "ResetClockPhase",
-                    "pulse_info": [
-                        {
-                            "wf_func": None,
-                            "clock": clock,
-                            "t0": t0,
-                            "duration": 0,
-                            "port": None,
-                            "reset_clock_phase": True,
-                        }
-                    ],
+                    "wf_func": None,
+                    "clock": _intern(clock),
+                    "t0": t0,
+                    "duration": 0,
+                    "port": None,
+                    "reset_clock_phase": True,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -191,7 +207,7 @@ class SetClockFrequency(Operation):
             {
                 "wf_func": None,
                 "t0": t0,
-                "clock": clock,
+                "clock": _intern(clock),
                 "clock_freq_new": clock_freq_new,
                 "clock_freq_old": None,
                 "interm_freq_old": None,
@@ -248,8 +264,8 @@ class VoltageOffset(Operation):
                 "t0": t0,
                 "offset_path_0": offset_path_0,
                 "offset_path_1": offset_path_1,
-                "clock": clock,
-                "port": port,
+                "clock": _intern(clock),
+                "port": _intern(port),
                 "duration": duration,
             }
         ]
@@ -286,20 +302,9 @@ class IdlePulse(Operation):
         """
         if data is None:
             super().__init__(name="Idle")
-            self.data.update(
-                {
-                    "name": "Idle",
-                    "pulse_info": [
-                        {
-                            "wf_func": None,
-                            "t0": 0,
-                            "duration": duration,
-                            "clock": BasebandClockResource.IDENTITY,
-                            "port": None,
-                        }
-                    ],
-                }
-            )
+            pulse_info = _IDLE_PULSE_INFO.copy()
+            pulse_info["duration"] = duration
+            self.data["pulse_info"] = [pulse_info]
             self._update()
         else:
             warnings.warn(
@@ -376,23 +381,18 @@ class RampPulse(Operation):
         """
         if data is None:
             super().__init__(name="RampPulse")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "RampPulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.ramp",
-                            "amp": amp,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "offset": offset,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.ramp",
+                    "amp": amp,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "offset": offset,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -460,25 +460,19 @@ class StaircasePulse(Operation):  # pylint: disable=too-many-ancestors
         """
         if data is None:
             super().__init__(name="StaircasePulse")
-
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "StaircasePulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.staircase",
-                            "start_amp": start_amp,
-                            "final_amp": final_amp,
-                            "reference_magnitude": reference_magnitude,
-                            "num_steps": num_steps,
-                            "duration": duration,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.staircase",
+                    "start_amp": start_amp,
+                    "final_amp": final_amp,
+                    "reference_magnitude": reference_magnitude,
+                    "num_steps": num_steps,
+                    "duration": duration,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -532,10 +526,15 @@ class SquarePulse(Operation):
             Scaling value and unit for the unitless amplitude. Uses settings in
             hardware config if not provided.
         phase
-            Phase of the pulse in degrees.
+            Phase of the pulse in degrees. Only a phase of 0 is currently supported.
         t0
             Time in seconds when to start the pulses relative to the start time
             of the Operation in the Schedule.
+
+        Raises
+        ------
+        NotImplementedError
+            If a non-zero phase is passed.
         """
         if phase != 0:
             # Because of how clock interfaces were changed.
@@ -545,23 +544,18 @@ class SquarePulse(Operation):
 
         if data is None:
             super().__init__(name="ModSquarePulse")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "ModSquarePulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.square",
-                            "amp": amp,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "phase": phase,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.square",
+                    "amp": amp,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "phase": phase,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -639,28 +633,23 @@ class SuddenNetZeroPulse(Operation):
 
         if data is None:
             super().__init__(name="SuddenNetZeroPulse")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "SuddenNetZeroPulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.sudden_net_zero",
-                            "amp_A": amp_A,
-                            "amp_B": amp_B,
-                            "reference_magnitude": reference_magnitude,
-                            "net_zero_A_scale": net_zero_A_scale,
-                            "t_pulse": t_pulse,
-                            "t_phi": t_phi,
-                            "t_integral_correction": t_integral_correction,
-                            "duration": duration,
-                            "phase": 0,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.sudden_net_zero",
+                    "amp_A": amp_A,
+                    "amp_B": amp_B,
+                    "reference_magnitude": reference_magnitude,
+                    "net_zero_A_scale": net_zero_A_scale,
+                    "t_pulse": t_pulse,
+                    "t_phi": t_phi,
+                    "t_integral_correction": t_integral_correction,
+                    "duration": duration,
+                    "phase": 0,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -772,22 +761,17 @@ class SoftSquarePulse(Operation):
         """
         if data is None:
             super().__init__(name="SoftSquarePulse")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "SoftSquarePulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.soft_square",
-                            "amp": amp,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.soft_square",
+                    "amp": amp,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -847,24 +831,19 @@ class ChirpPulse(Operation):  # pylint: disable=too-many-ancestors
         """
         if data is None:
             super().__init__(name="ChirpPulse")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "ChirpPulse",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.chirp",
-                            "amp": amp,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "start_freq": start_freq,
-                            "end_freq": end_freq,
-                            "t0": t0,
-                            "clock": clock,
-                            "port": port,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.chirp",
+                    "amp": amp,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "start_freq": start_freq,
+                    "end_freq": end_freq,
+                    "t0": t0,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -940,25 +919,20 @@ class DRAGPulse(Operation):
 
         if data is None:
             super().__init__(name="DRAG")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "DRAG",
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.drag",
-                            "G_amp": G_amp,
-                            "D_amp": D_amp,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "phase": phase,
-                            "nr_sigma": 4,
-                            "clock": clock,
-                            "port": port,
-                            "t0": t0,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.drag",
+                    "G_amp": G_amp,
+                    "D_amp": D_amp,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "phase": phase,
+                    "nr_sigma": 4,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
+                    "t0": t0,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -1087,7 +1061,7 @@ def create_dc_compensation_pulse(
         amp=c_amp,
         duration=c_duration,
         port=port,
-        clock=BasebandClockResource.IDENTITY,
+        clock=_BASEBAND_IDENTITY,
         phase=0,
         t0=t0,
         data=data,
@@ -1100,10 +1074,7 @@ def _extract_pulses(pulses: List[Operation], port: str) -> List[Dict[str, Any]]:
 
     for pulse in pulses:
         for pulse_info in pulse["pulse_info"]:
-            if (
-                pulse_info["port"] == port
-                and pulse_info["clock"] == BasebandClockResource.IDENTITY
-            ):
+            if pulse_info["port"] == port and pulse_info["clock"] == _BASEBAND_IDENTITY:
                 pulse_info_list.append(pulse_info)
 
     return pulse_info_list
@@ -1129,20 +1100,15 @@ class WindowOperation(Operation):
         """
         if data is None:
             super().__init__(name="WindowOperation")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "name": "WindowOperation",
-                    "pulse_info": [
-                        {
-                            "wf_func": None,
-                            "window_name": window_name,
-                            "duration": duration,
-                            "t0": t0,
-                            "port": None,
-                        }
-                    ],
+                    "wf_func": None,
+                    "window_name": window_name,
+                    "duration": duration,
+                    "t0": t0,
+                    "port": None,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -1229,24 +1195,19 @@ class NumericalPulse(Operation):
         samples, t_samples = map(make_list_from_array, [samples, t_samples])
         if data is None:
             super().__init__(name="NumericalPulse")
-            self.data.update(
-                {
-                    "name": "NumericalPulse",
-                    "pulse_info": [
-                        {  # pylint: disable=line-too-long
-                            "wf_func": "quantify_scheduler.waveforms.interpolated_complex_waveform",
-                            "samples": samples,
-                            "t_samples": t_samples,
-                            "reference_magnitude": reference_magnitude,
-                            "duration": duration,
-                            "interpolation": interpolation,
-                            "clock": clock,
-                            "port": port,
-                            "t0": t0,
-                        }
-                    ],
+            self.data["pulse_info"] = [
+                {  # pylint: disable=line-too-long
+                    "wf_func": "quantify_scheduler.waveforms.interpolated_complex_waveform",
+                    "samples": samples,
+                    "t_samples": t_samples,
+                    "reference_magnitude": reference_magnitude,
+                    "duration": duration,
+                    "interpolation": interpolation,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
+                    "t0": t0,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -1318,23 +1279,19 @@ class SkewedHermitePulse(Operation):
 
         if data is None:
             super().__init__(name="hermite")
-            self.data.update(
+            self.data["pulse_info"] = [
                 {
-                    "pulse_info": [
-                        {
-                            "wf_func": "quantify_scheduler.waveforms.skewed_hermite",
-                            "duration": duration,
-                            "amplitude": amplitude,
-                            "reference_magnitude": reference_magnitude,
-                            "skewness": skewness,
-                            "phase": phase,
-                            "clock": clock,
-                            "port": port,
-                            "t0": t0,
-                        }
-                    ],
+                    "wf_func": "quantify_scheduler.waveforms.skewed_hermite",
+                    "duration": duration,
+                    "amplitude": amplitude,
+                    "reference_magnitude": reference_magnitude,
+                    "skewness": skewness,
+                    "phase": phase,
+                    "clock": _intern(clock),
+                    "port": _intern(port),
+                    "t0": t0,
                 }
-            )
+            ]
             self._update()
         else:
             warnings.warn(
@@ -8,22 +8,50 @@ using matplotlib.
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Tuple, Union
+import warnings
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-import matplotlib.patches
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.axes import Axes
 
-# For type hints, import modules to avoid circular dependencies
-from matplotlib.figure import Figure
+from quantify_scheduler.visualization import constants
 
-from quantify_core.utilities import deprecated
-from quantify_scheduler.visualization import constants, pulse_diagram
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _unit_x(samples: int) -> np.ndarray:
+    """
+    Returns a read-only template for the time axis of a drawn pulse, which is scaled
+    and shifted to each pulse. Single precision suffices, as the curves are only drawn.
+    """
+    x = np.linspace(0, 1, samples, dtype=np.float32)
+    x.setflags(write=False)
+    return x
+
+
+def _estimate_samples(ax: Axes, pos: float, width: float) -> int:
+    """
+    Returns the number of samples to draw a pulse with: about one per pixel that the
+    pulse spans on the axes, clipped to [16, 100].
+
+    The pixels are estimated from the figure size and dpi, assuming that the data
+    drawn so far, including this pulse, spans the width of the axes. The view limits
+    are not used, as reading them autoscales the axes halfway through drawing. The
+    data only grows as pulses are added, so the estimate errs on the side of too
+    many samples.
+    """
+    fig = ax.figure
+    axes_pixels = fig.get_figwidth() * fig.dpi * ax.get_position(original=True).width
+    x_min, x_max = ax.dataLim.intervalx
+    span = max(x_max, pos + width) - min(x_min, pos)
+    return int(min(max(axes_pixels * width / span, 16), 100))
+
+
 def new_pulse_fig(
     figsize: Optional[Tuple[int, int]] = None, ax: Optional[Axes] = None
 ) -> Tuple[Figure, Union[Axes, List[Axes]]]:
@@ -43,6 +71,8 @@ def new_pulse_fig(
 
     """
     if ax is None:
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         fig, ax = plt.subplots(1, 1, figsize=figsize, frameon=False)
     else:
         fig = None
@@ -82,6 +112,28 @@ def new_pulse_subplot(fig: Figure, *args, **kwargs) -> Axes:
     return ax
 
 
+@lru_cache(maxsize=32)
+def _mw_pulse_profile(
+    samples: int, cycles: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tabulates the Gaussian envelope of a microwave pulse of unit width and amplitude,
+    and the sine and cosine of a carrier with ``cycles`` periods over the pulse.
+    """
+    unit_x = _unit_x(samples)
+    env = np.subtract(unit_x, 0.5)
+    env *= 4
+    np.square(env, out=env)
+    np.negative(env, out=env)
+    np.exp(env, out=env)
+    carrier = unit_x * (2 * np.pi * cycles)
+    sin_carrier = np.sin(carrier)
+    cos_carrier = np.cos(carrier, out=carrier)
+    for table in (env, sin_carrier, cos_carrier):
+        table.setflags(write=False)
+    return env, sin_carrier, cos_carrier
+
+
 def mwPulse(
     ax: Axes,
     pos: float,
@@ -93,6 +145,7 @@ def mwPulse(
     label_height: float = 1.3,
     color: str = constants.COLOR_ORANGE,
     modulation: str = "normal",
+    samples: Optional[int] = 100,
     **plot_kws,
 ) -> float:
     """
@@ -119,25 +172,43 @@ def mwPulse(
 
     modulation :
 
+    samples :
+        Number of samples to draw the pulse with. If None, about one sample per pixel
+        that the pulse spans on the axes is used, between 16 and 100, which is faster
+        for small pulses.
+
     Returns
     -------
     :
 
     """
-    x = np.linspace(pos, pos + width, 100)
-    envPos = amp * np.exp(-((x - (pos + width / 2)) ** 2) / (width / 4) ** 2)
-    envNeg = -amp * np.exp(-((x - (pos + width / 2)) ** 2) / (width / 4) ** 2)
-
     if modulation == "normal":
-        mod = envPos * np.sin(2 * np.pi * 3 / width * x + phase)
+        cycles = 3
     elif modulation == "high":
-        mod = envPos * np.sin(5 * np.pi * 3 / width * x + phase)
+        cycles = 7.5
     else:
         raise ValueError()
-
-    ax.plot(x, envPos + y_offs, "--", color=color, **plot_kws)
-    ax.plot(x, envNeg + y_offs, "--", color=color, **plot_kws)
-    ax.plot(x, mod + y_offs, "-", color=color, **plot_kws)
+    if samples is None:
+        samples = _estimate_samples(ax, pos, width)
+    x = _unit_x(samples) * width
+    x += pos
+    env, sin_carrier, cos_carrier = _mw_pulse_profile(samples, cycles)
+    envPos = env * amp
+
+    # Shift the tabulated carrier to the phase at the start of the pulse, using
+    # sin(a + b) = sin(a)cos(b) + cos(a)sin(b)
+    start_phase = 2 * np.pi * cycles / width * pos + phase
+    mod = np.multiply(sin_carrier, np.cos(start_phase))
+    mod += np.sin(start_phase) * cos_carrier
+    mod *= envPos
+    mod += y_offs
+    # The vertical offset is applied in place, as the arrays are only drawn
+    envNeg = np.subtract(y_offs, envPos)
+    envPos += y_offs
+
+    ax.plot(x, envPos, "--", color=color, **plot_kws)
+    ax.plot(x, envNeg, "--", color=color, **plot_kws)
+    ax.plot(x, mod, "-", color=color, **plot_kws)
 
     if label is not None:
         ax.text(
@@ -151,6 +222,52 @@ def mwPulse(
     return pos + width
 
 
+def _fermi_dirac_envelope(
+    x: np.ndarray, rise_center: float, fall_center: float, s: float, amp: float
+) -> np.ndarray:
+    """
+    Computes a pulse envelope with rising and falling edges given by Fermi-Dirac
+    functions, reusing two buffers instead of allocating a temporary per operation.
+    """
+    rise = np.subtract(rise_center, x)
+    rise /= s
+    np.exp(rise, out=rise)
+    rise += 1
+    fall = np.subtract(x, fall_center)
+    fall /= s
+    np.exp(fall, out=fall)
+    fall += 1
+    rise *= fall
+    return np.true_divide(amp, rise, out=rise)
+
+
+@lru_cache(maxsize=16)
+def _fermi_dirac_profile(s_norm: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tabulates the envelope of a flux pulse of unit width and amplitude, with edge
+    smoothness ``s_norm`` relative to the width.
+    """
+    x_table = np.linspace(0, 1, 256)
+    y_table = _fermi_dirac_envelope(x_table, 5.5 * s_norm, 1 - 5.5 * s_norm, s_norm, 1)
+    x_table.setflags(write=False)
+    y_table.setflags(write=False)
+    return x_table, y_table
+
+
+def _flux_envelope(
+    x: np.ndarray, pos: float, width: float, s: float, amp: float, exact: bool
+) -> np.ndarray:
+    """
+    Returns the envelope of a flux pulse, either evaluated exactly or interpolated
+    from a cached table of the normalized envelope.
+    """
+    if exact:
+        return _fermi_dirac_envelope(x, pos + 5.5 * s, pos + width - 5.5 * s, s, amp)
+    y = np.interp((x - pos) / width, *_fermi_dirac_profile(s / width))
+    y *= amp
+    return y
+
+
 def fluxPulse(
     ax: Axes,
     pos: float,
@@ -161,6 +278,8 @@ def fluxPulse(
     label: Optional[str] = None,
     label_height: float = 1.7,
     color: str = constants.COLOR_ORANGE,
+    exact: bool = False,
+    samples: Optional[int] = 100,
     **plot_kws,
 ) -> float:
     """
@@ -187,16 +306,24 @@ def fluxPulse(
 
     color :
 
+    exact :
+        If True, the edges are evaluated at every sample instead of interpolated
+        from a cached table.
+    samples :
+        Number of samples to draw the pulse with. If None, about one sample per pixel
+        that the pulse spans on the axes is used, between 16 and 100, which is faster
+        for small pulses.
+
     Returns
     -------
     :
 
     """
-    x = np.linspace(pos, pos + width, 100)
-    y = amp / (
-        (np.exp(-(x - (pos + 5.5 * s)) / s) + 1)
-        * (np.exp((x - (pos + width - 5.5 * s)) / s) + 1)
-    )
+    if samples is None:
+        samples = _estimate_samples(ax, pos, width)
+    x = _unit_x(samples) * width
+    x += pos
+    y = _flux_envelope(x, pos, width, s, amp, exact)
 
     ax.fill_between(x, y + y_offs, y_offs, color=color, alpha=0.3)
     ax.plot(x, y + y_offs, color=color, **plot_kws)
@@ -222,6 +349,8 @@ def ramZPulse(
     amp: float = 1.5,
     sep: float = 1.5,
     color: str = constants.COLOR_ORANGE,
+    exact: bool = False,
+    samples: Optional[int] = 100,
 ) -> float:
     """
     Draw a Ram-Z flux pulse, i.e. only part of the pulse is shaded, to indicate
@@ -245,18 +374,28 @@ def ramZPulse(
 
     color :
 
+    exact :
+        If True, the edges are evaluated at every sample instead of interpolated
+        from a cached table.
+    samples :
+        Number of samples to draw the pulse with. If None, about one sample per pixel
+        that the pulse spans on the axes is used, between 16 and 100, which is faster
+        for small pulses.
+
     Returns
     -------
     :
 
     """
-    xLeft = np.linspace(pos, pos + sep, 100)
-    xRight = np.linspace(pos + sep, pos + width, 100)
+    if samples is None:
+        samples = _estimate_samples(ax, pos, width)
+    unit_x = _unit_x(samples)
+    xLeft = unit_x * sep
+    xLeft += pos
+    xRight = unit_x * (width - sep)
+    xRight += pos + sep
     xFull = np.concatenate((xLeft, xRight))
-    y = amp / (
-        (np.exp(-(xFull - (pos + 5.5 * s)) / s) + 1)
-        * (np.exp((xFull - (pos + width - 5.5 * s)) / s) + 1)
-    )
+    y = _flux_envelope(xFull, pos, width, s, amp, exact)
     yLeft = y[: len(xLeft)]
 
     ax.fill_between(
@@ -313,6 +452,8 @@ def interval(
     if label_height is None:
         label_height = height + 0.2
 
+    import matplotlib.patches  # pylint: disable=import-outside-toplevel
+
     arrow = matplotlib.patches.FancyArrowPatch(
         posA=(start, height + y_offs),
         posB=(stop, height + y_offs),
@@ -377,6 +518,8 @@ def meter(
     :
 
     """
+    import matplotlib.patches  # pylint: disable=import-outside-toplevel
+
     if fillcolor is None:
         fill = False
     else:
@@ -458,6 +601,8 @@ def box_text(
     :
 
     """
+    import matplotlib.patches  # pylint: disable=import-outside-toplevel
+
     if fillcolor is None:
         fill = False
     else:
@@ -486,10 +631,19 @@ def box_text(
     ).set_clip_on(True)
 
 
-@deprecated(
-    "0.13.0",
-    "`pulse_diagram_plotly` has moved to a new module, please import from "
-    "`quantify_scheduler.visualization.pulse_diagram` instead.",
-)
 def pulse_diagram_plotly(*args, **kwargs):
+    """
+    Deprecated alias of
+    :func:`quantify_scheduler.visualization.pulse_diagram.pulse_diagram_plotly`.
+    """
+    warnings.warn(
+        "`pulse_diagram_plotly` has moved to a new module, please import from "
+        "`quantify_scheduler.visualization.pulse_diagram` instead. This alias is "
+        "deprecated and will be removed in quantify-scheduler-0.13.0.",
+        FutureWarning,
+        stacklevel=2,
+    )
+    # pylint: disable=import-outside-toplevel
+    from quantify_scheduler.visualization import pulse_diagram
+
     return pulse_diagram.pulse_diagram_plotly(*args, **kwargs)
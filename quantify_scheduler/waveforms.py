@@ -16,7 +16,7 @@ from scipy import signal, interpolate
 
 
 def square(t: Union[np.ndarray, List[float]], amp: Union[float, complex]) -> np.ndarray:
-    return amp * np.ones(len(t))
+    return np.full(len(t), amp, dtype=np.result_type(amp, np.float64))
 
 
 def square_imaginary(
@@ -86,7 +86,8 @@ def soft_square(t, amp):
     data = square(t, amp)
     if len(t) > 1:
         window = signal.windows.hann(int(len(t) / 2))
-        data = signal.convolve(data, window, mode="same") / sum(window)
+        data = signal.convolve(data, window, mode="same")
+        data /= window.sum()
     return data
 
 
@@ -119,7 +120,13 @@ def chirp(t: np.ndarray, amp: float, start_freq: float, end_freq: float) -> np.n
         The complex waveform.
     """
     chirp_rate = (end_freq - start_freq) / (t[-1] - t[0])
-    return amp * np.exp(1.0j * 2 * np.pi * (chirp_rate * t / 2 + start_freq) * t)
+    # The phase is built up in place to avoid allocating a temporary per operation.
+    phase = np.multiply(t, np.pi * chirp_rate, dtype=np.float64)
+    phase += 2 * np.pi * start_freq
+    phase *= t
+    waveform = np.exp(1.0j * phase)
+    waveform *= amp
+    return waveform
 
 
 # pylint: disable=too-many-arguments
@@ -185,20 +192,30 @@ def drag(
 
     sigma = duration / (2 * nr_sigma)
 
-    gauss_env = G_amp * np.exp(-(0.5 * ((t - mu) ** 2) / sigma**2))
-    deriv_gauss_env = -D_amp * (t - mu) / (sigma**1) * gauss_env
+    # The envelopes are computed in place and with the scalar factors combined, to
+    # avoid a temporary array and a pass over the samples per intermediate result.
+    t_rel = t - mu
+    gauss_env = np.square(t_rel)
+    gauss_env *= -0.5 / sigma**2
+    np.exp(gauss_env, out=gauss_env)
+    gauss_env *= G_amp
+
+    deriv_gauss_env = t_rel
+    deriv_gauss_env *= -D_amp / sigma
+    deriv_gauss_env *= gauss_env
 
     # Subtract offsets
-    if subtract_offset.lower() == "none" or subtract_offset is None:
+    offset_mode = "none" if subtract_offset is None else subtract_offset.lower()
+    if offset_mode == "none":
         # Do not subtract offset
         pass
-    elif subtract_offset.lower() == "average":
+    elif offset_mode == "average":
         gauss_env -= (gauss_env[0] + gauss_env[-1]) / 2.0
         deriv_gauss_env -= (deriv_gauss_env[0] + deriv_gauss_env[-1]) / 2.0
-    elif subtract_offset.lower() == "first":
+    elif offset_mode == "first":
         gauss_env -= gauss_env[0]
         deriv_gauss_env -= deriv_gauss_env[0]
-    elif subtract_offset.lower() == "last":
+    elif offset_mode == "last":
         gauss_env -= gauss_env[-1]
         deriv_gauss_env -= deriv_gauss_env[-1]
     else:
@@ -209,12 +226,15 @@ def drag(
         )
 
     # generate pulses
-    drag_wave = gauss_env + 1j * deriv_gauss_env
+    drag_wave = np.empty(len(t), dtype=np.complex128)
+    drag_wave.real = gauss_env
+    drag_wave.imag = deriv_gauss_env
 
     # Apply phase rotation
-    rot_drag_wave = rotate_wave(drag_wave, phase=phase)
+    angle = np.deg2rad(phase)
+    drag_wave *= np.cos(angle) + 1.0j * np.sin(angle)
 
-    return rot_drag_wave
+    return drag_wave
 
 
 def sudden_net_zero(
@@ -169,6 +169,57 @@ class TestGenericPulseStrategy:
         assert strategy.amplitude_path0 == amp_imag
         assert strategy.amplitude_path1 == amp_real
 
+    @pytest.mark.parametrize("extra_data", [{}, {"unhashable": [1, 2]}])
+    def test_generate_data_repeated_pulse(self, extra_data):
+        # arrange
+        data = {
+            "wf_func": "quantify_scheduler.waveforms.drag",
+            "duration": 24e-9,
+            "G_amp": 0.1234,
+            "D_amp": 1,
+            "nr_sigma": 3,
+            "phase": 0,
+            **extra_data,
+        }
+        strategies = [
+            pulses.GenericPulseStrategy(
+                types.OpInfo(name="", data=dict(data), timing=0), io_mode="complex"
+            )
+            for _ in range(2)
+        ]
+        wf_dicts = [{}, {}]
+
+        # act
+        for strategy, wf_dict in zip(strategies, wf_dicts):
+            strategy.generate_data(wf_dict=wf_dict)
+
+        # assert
+        assert wf_dicts[0] == wf_dicts[1]
+        assert strategies[0].amplitude_path0 == strategies[1].amplitude_path0
+        assert strategies[0].amplitude_path1 == strategies[1].amplitude_path1
+        assert strategies[0].waveform_len == strategies[1].waveform_len
+
+    def test_generate_data_redefined_waveform_function(self, mocker):
+        # arrange
+        data = {"wf_func": "custom_module.custom_wf", "duration": 24e-9}
+        import_stub = mocker.patch(
+            "quantify_scheduler.helpers.waveforms.import_python_object_from_string",
+            return_value=lambda t: np.full(len(t), 0.5),
+        )
+        pulses.clear_waveform_caches()
+        strategy = pulses.GenericPulseStrategy(
+            types.OpInfo(name="", data=data, timing=0), io_mode="complex"
+        )
+        strategy.generate_data(wf_dict={})
+
+        # act
+        import_stub.return_value = lambda t: np.full(len(t), 0.25)
+        pulses.clear_waveform_caches()
+        strategy.generate_data(wf_dict={})
+
+        # assert
+        assert strategy.amplitude_path0 == 0.25
+
     @pytest.mark.parametrize(
         "io_mode",
         ["real", "imag"],
@@ -360,6 +411,16 @@ class TestStitchedSquarePulseStrategy:
                     ["", "loop", "R0,@stitch1", ""],
                 ],
             ),
+            (
+                3e-4,  # 3e-4 // 1e-6 == 299.0 in floating point
+                [
+                    ["", "set_awg_gain", "32767,0", "# setting gain for test_pulse"],
+                    ["", "move", "300,R0", "# iterator for loop with label stitch1"],
+                    ["stitch1:", "", "", ""],
+                    ["", "play", "0,1,1000", ""],
+                    ["", "loop", "R0,@stitch1", ""],
+                ],
+            ),
         ],
     )
     def test_insert_qasm(self, empty_qasm_program_qcm, duration, answer):
@@ -166,3 +166,14 @@ def test_no_parameter_update(op_list: List[OpInfo]):
     assert len(component._pulses[(DEFAULT_PORT, DEFAULT_CLOCK)]) == 3
     for op in component._pulses[(DEFAULT_PORT, DEFAULT_CLOCK)]:
         assert op.name != "UpdateParameters"
+
+
+def test_extend_pulses():
+    """Test that extend_pulses assigns pulses in the same way as add_pulse."""
+    ops = [pulse_with_waveform(0.0), virtual_pulse(1e-7), pulse_with_waveform(2e-7)]
+    component = QrmRfModule(
+        parent=Mock(), name="Test", total_play_time=3e-7, instrument_cfg={}
+    )
+    component.extend_pulses((DEFAULT_PORT, DEFAULT_CLOCK, op) for op in ops)
+
+    assert component._pulses[(DEFAULT_PORT, DEFAULT_CLOCK)] == ops
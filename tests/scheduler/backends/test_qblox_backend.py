@@ -54,6 +54,8 @@ from quantify_scheduler.compilation import determine_absolute_timing
 from quantify_scheduler.helpers.collections import (
     find_inner_dicts_containing_key,
     find_all_port_clock_combinations,
+    find_port_clock_path,
+    find_port_clock_paths,
 )
 from quantify_scheduler.operations.acquisition_library import (
     SSBIntegrationComplex,
@@ -475,6 +477,14 @@ def test_find_all_port_clock_combinations(
     assert portclocks == answer
 
 
+def test_find_port_clock_paths(hardware_cfg_qblox_example):
+    pc_paths = find_port_clock_paths(hardware_cfg_qblox_example)
+    for port, clock in find_all_port_clock_combinations(hardware_cfg_qblox_example):
+        assert pc_paths[(port, clock)] == find_port_clock_path(
+            hardware_config=hardware_cfg_qblox_example, port=port, clock=clock
+        )
+
+
 def test_generate_port_clock_to_device_map(
     hardware_cfg_qblox_example,
     hardware_cfg_pulsar,
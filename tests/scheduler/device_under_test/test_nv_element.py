@@ -156,6 +156,27 @@ def test_generate_device_config(electronic_q0: BasicElectronicNVElement):
     """Generating device config returns DeviceCompilationConfig."""
     dev_cfg = electronic_q0.generate_device_config()
     assert isinstance(dev_cfg, DeviceCompilationConfig)
+    assert dev_cfg == DeviceCompilationConfig.parse_obj(dev_cfg.dict())
+
+
+def test_generate_device_config_cached(electronic_q0: BasicElectronicNVElement):
+    """
+    Device config is cached until a parameter of the element changes, and modifying
+    the returned config does not affect the cache.
+    """
+    dev_cfg = electronic_q0.generate_device_config()
+    reset_kwargs = dev_cfg.elements["qe0"]["reset"].factory_kwargs
+    duration = reset_kwargs["duration"]
+    reset_kwargs["duration"] = 1.0
+    cached = electronic_q0.generate_device_config()
+    assert cached.elements["qe0"]["reset"].factory_kwargs["duration"] == duration
+
+    electronic_q0.clock_freqs.f01(3.5e9)
+    electronic_q0.reset.duration(2e-6)
+    new_dev_cfg = electronic_q0.generate_device_config()
+    assert new_dev_cfg is not dev_cfg
+    assert new_dev_cfg.clocks["qe0.f01"] == 3.5e9
+    assert new_dev_cfg.elements["qe0"]["reset"].factory_kwargs["duration"] == 2e-6
 
 
 def test_mock_nv_setup():
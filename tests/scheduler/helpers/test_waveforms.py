@@ -54,6 +54,7 @@ def test_resize_waveform(size: int, granularity: int, expected: int) -> None:
 
     # Assert
     assert len(waveform) == expected
+    assert waveform.flags.writeable
 
 
 @pytest.mark.parametrize(
@@ -146,6 +147,8 @@ def test_get_waveform_by_pulseid_empty(empty_schedule: Schedule) -> None:
         ("quantify_scheduler.waveforms.square"),
         ("quantify_scheduler.waveforms.ramp"),
         ("quantify_scheduler.waveforms.soft_square"),
+        ("quantify_scheduler.waveforms.staircase"),
+        ("quantify_scheduler.waveforms.chirp"),
         ("quantify_scheduler.waveforms.drag"),
     ],
 )
@@ -157,6 +160,11 @@ def test_exec_waveform_function(wf_func: str, mocker: MockerFixture) -> None:
         "amp": 0.5,
         "offset": 0,
         "duration": pulse_duration,
+        "start_amp": 0.1,
+        "final_amp": 0.5,
+        "num_steps": 4,
+        "start_freq": 1e6,
+        "end_freq": 2e6,
         "G_amp": 0.7,
         "D_amp": -0.2,
         "nr_sigma": 3,
@@ -207,6 +215,26 @@ def test_exec_waveform_function_with_custom(
     assert waveform == []
 
 
+def test_exec_waveform_function_with_custom_read_only_t(
+    mocker: MockerFixture,
+) -> None:
+    # Arrange
+    t = np.arange(0, 1e-8, 1e-9)
+    t.setflags(write=False)
+    wavefn_stub = mocker.patch(
+        "quantify_scheduler.helpers.waveforms.exec_custom_waveform_function",
+        return_value=[],
+    )
+
+    # Act
+    exec_waveform_function("module.function", t, pulse_info={"duration": 1e-8})
+
+    # Assert
+    t_custom = wavefn_stub.call_args.args[1]
+    assert t_custom.flags.writeable
+    np.testing.assert_array_equal(t_custom, t)
+
+
 def test_exec_custom_waveform_function(mocker: MockerFixture) -> None:
     # Arrange
     t = np.arange(0, 10, 1)
@@ -235,6 +263,23 @@ def test_exec_custom_waveform_function(mocker: MockerFixture) -> None:
     mock.assert_called_with(t=t, duration=1.4e-9, t0=0)
 
 
+def test_exec_custom_waveform_function_redefined(mocker: MockerFixture) -> None:
+    # Arrange
+    t = np.arange(0, 10, 1)
+    import_stub = mocker.patch(
+        "quantify_scheduler.helpers.waveforms.import_python_object_from_string",
+        return_value=lambda t, amp: amp * t,
+    )
+    exec_custom_waveform_function("custom_module.custom_wf", t, {"amp": 2})
+
+    # Act
+    import_stub.return_value = lambda t, amp: -amp * t
+    waveform = exec_custom_waveform_function("custom_module.custom_wf", t, {"amp": 2})
+
+    # Assert
+    np.testing.assert_array_equal(waveform, -2 * t)
+
+
 def test_shift_waveform_misaligned() -> None:
     # Arrange
     clock_rate: int = 2400000000
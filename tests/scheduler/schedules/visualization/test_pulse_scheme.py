@@ -62,6 +62,63 @@ def test_plot_pulses_n_q() -> Figure:
     return fig
 
 
+def test_pulse_scheme_builder() -> None:
+    fig, ax = pls.new_pulse_fig((7 * cm, 3 * cm))
+    n_lines = len(ax.lines)
+
+    builder = pls.PulseSchemeBuilder(ax)
+    p1 = builder.mwPulse(0, width=1.5, label="$X_{\\pi/2}$")
+    p2 = builder.fluxPulse(p1, label="CZ")
+    p3 = builder.ramZPulse(p2, width=2.5, sep=1.5)
+    builder.interval(p1, p1 + 1.5, height=1.7, label="$T_\\mathsf{p}$")
+
+    assert p3 == pytest.approx(6.5)
+    assert len(ax.collections) == 0
+    builder.flush()
+
+    # Dashed and solid orange lines, dashed black lines and two fill styles
+    assert len(ax.lines) == n_lines
+    assert len(ax.collections) == 5
+    assert len(ax.patches) == 1
+    plt.close(fig)
+
+
+def test_pulse_scheme_builder_plot_kws() -> None:
+    fig, ax = pls.new_pulse_fig((7 * cm, 3 * cm))
+    n_lines = len(ax.lines)
+
+    builder = pls.PulseSchemeBuilder(ax)
+    # Unhashable keyword arguments are plotted right away
+    builder.mwPulse(0, dashes=[2, 2])
+    assert len(ax.lines) == n_lines + 3
+
+    with pytest.raises(ValueError, match="Unsupported format 'r--'"):
+        builder.plot([0, 1], [0, 1], "r--")
+    plt.close(fig)
+
+
+def test_pulse_samples() -> None:
+    fig, ax = pls.new_pulse_fig((7 * cm, 3 * cm))
+    n_lines = len(ax.lines)
+
+    p1 = pls.mwPulse(ax, 0, samples=20)
+    pls.fluxPulse(ax, p1, samples=30)
+    assert [len(line.get_xdata()) for line in ax.lines[n_lines:]] == [20, 20, 20, 30]
+
+    pls.mwPulse(ax, 0)
+    assert len(ax.lines[-1].get_xdata()) == 100
+    plt.close(fig)
+
+    # Without samples, the number depends on the size of the pulse on the axes
+    fig, ax = pls.new_pulse_fig((7 * cm, 3 * cm))
+    pls.mwPulse(ax, 0, width=1, samples=None)
+    assert len(ax.lines[-1].get_xdata()) == 100
+    ax.plot([0, 1000], [0, 0])
+    pls.mwPulse(ax, 0, width=1, samples=None)
+    assert len(ax.lines[-1].get_xdata()) == 16
+    plt.close(fig)
+
+
 @pytest.mark.mpl_image_compare(style="default", savefig_kwargs={"dpi": 300})
 def test_plot_pulses_single_q_deprecated() -> Figure:
     """
@@ -112,3 +169,13 @@ def test_plot_pulses_n_q_deprecated() -> Figure:
 
     fig.subplots_adjust(left=0.07, top=0.9, hspace=0.1)
     return fig
+
+
+@pytest.mark.parametrize("module", [pls, pls_d])
+def test_pulse_diagram_plotly_warns_every_call(module, mocker) -> None:
+    mocker.patch(
+        f"{module.__name__.rsplit('.', 1)[0]}.pulse_diagram.pulse_diagram_plotly"
+    )
+    for _ in range(2):
+        with pytest.warns(FutureWarning, match="has moved to a new module"):
+            module.pulse_diagram_plotly()